@@ -6,7 +6,7 @@ import firebase_admin
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.routing import APIRoute
+from fastapi.routing import APIRoute, iter_route_contexts
 
 import app.models as models
 from app.dependencies.services import (
@@ -16,10 +16,18 @@ from app.dependencies.services import (
 from app.services.jobs import init_jobs
 
 from .config import settings
-from .middleware import UnhandledExceptionMiddleware, log_request_validation_error
+from .middleware import (
+    CredentialSafeGZipMiddleware,
+    UnhandledExceptionMiddleware,
+    log_request_validation_error,
+)
 from .models import init_app as init_models
 from .routers import init_app as init_routers
 
+# Responses whose body carries an access token. They are never gzipped: see
+# CredentialSafeGZipMiddleware.
+UNCOMPRESSED_PATHS = frozenset({"/auth/login", "/auth/refresh", "/drivers/register"})
+
 
 def configure_logging() -> None:
     """Configure application logging based on environment"""
@@ -167,17 +175,23 @@ def _assert_unique_operation_ids(app: FastAPI) -> None:
     but duplicates silently produce colliding function names in the generated
     TypeScript client. Catch the collision at startup instead of debugging a
     confusing client later — if this fires, rename one of the route handlers.
+    It fires too if a router is included twice.
+
+    ``app.routes`` holds one entry per included router, not its routes, so
+    the walk goes through ``iter_route_contexts``, which expands each
+    included router into its routes with their full prefixed paths.
     """
-    seen: dict[str, str] = {}
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            if route.name in seen:
+    seen: dict[str, str | None] = {}
+    for context in iter_route_contexts(app.routes):
+        if isinstance(context.original_route, APIRoute):
+            name = context.original_route.name
+            if name in seen:
                 raise ValueError(
-                    f"Duplicate OpenAPI operation ID '{route.name}': used by "
-                    f"both {seen[route.name]} and {route.path}. Route handler "
+                    f"Duplicate OpenAPI operation ID '{name}': used by "
+                    f"both {seen[name]} and {context.path}. Route handler "
                     "function names must be unique across routers."
                 )
-            seen[route.name] = route.path
+            seen[name] = context.path
 
 
 def create_app() -> FastAPI:
@@ -210,6 +224,18 @@ def create_app() -> FastAPI:
     # the outermost, and a 500 without CORS headers is unreadable to a browser.
     app.add_middleware(UnhandledExceptionMiddleware)
 
+    # Route lists and CSV exports run to tens of KB of repetitive JSON/CSV.
+    # Also inside CORS, so a compressed response still carries its CORS
+    # headers. Bodies under minimum_size (204s) pass untouched, and so do the
+    # token-bearing auth responses, which are over it but must not be
+    # compressed.
+    app.add_middleware(
+        CredentialSafeGZipMiddleware,
+        exclude_paths=UNCOMPRESSED_PATHS,
+        minimum_size=1000,
+        compresslevel=5,
+    )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=cors_origins,
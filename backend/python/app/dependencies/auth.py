@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from enum import StrEnum
@@ -10,31 +11,17 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.config import settings
+from app.dependencies.services import get_driver_service, get_user_service
 from app.models import get_session
 from app.models.announcement import Announcement
 from app.models.route import Route
-from app.services.implementations.auth_service import AuthService
-from app.services.implementations.driver_service import DriverService
-from app.services.implementations.email_service import EmailService
-from app.services.implementations.user_service import UserService
+from app.utilities.token_cache import verified_token_cache
 
-# Initialize services
+# Shared with route handlers via app.dependencies.services, so the process
+# holds one instance of each rather than a second set built at import.
 logger = logging.getLogger(__name__)
-driver_service = DriverService(logger)
-user_service = UserService(logger)
-email_service = EmailService(
-    logger,
-    {
-        "refresh_token": settings.mailer_refresh_token,
-        "token_uri": "https://oauth2.googleapis.com/token",
-        "client_id": settings.mailer_client_id,
-        "client_secret": settings.mailer_client_secret,
-    },
-    settings.mailer_user,
-    "Food4Kids",
-)
-auth_service = AuthService(logger, user_service, driver_service, email_service)
+driver_service = get_driver_service()
+user_service = get_user_service()
 
 # Security scheme
 security = HTTPBearer()
@@ -53,14 +40,45 @@ class DriverAccess(StrEnum):
     SELF = "self"
 
 
-def get_access_token(
+async def get_access_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> str:
     """Extract access token from Authorization header"""
     return credentials.credentials
 
 
-def _verified_token(access_token: str) -> dict[str, Any]:
+async def _verify_id_token(access_token: str) -> dict[str, Any]:
+    """
+    Verify a Firebase ID token, reusing a verification from the last few seconds.
+
+    A cache miss costs a blocking round-trip to Firebase (the revocation check,
+    plus a certificate fetch whenever Google rotates its keys), so it runs in a
+    worker thread rather than stalling every other request on the event loop.
+
+    ``clock_skew_seconds`` tolerates a client whose clock runs slightly ahead
+    of Google's, which would otherwise reject a freshly minted token as
+    issued in the future. See ``app.utilities.token_cache`` for how long a
+    cached verification is trusted and how revocations evict it.
+
+    :raises Exception: whatever ``verify_id_token`` raises; failures are
+        never cached.
+    """
+    cached = verified_token_cache.get(access_token)
+    if cached is not None:
+        return cached
+
+    generation = verified_token_cache.generation()
+    decoded_token: dict[str, Any] = await asyncio.to_thread(
+        firebase_admin.auth.verify_id_token,
+        access_token,
+        check_revoked=True,
+        clock_skew_seconds=5,
+    )
+    verified_token_cache.put(access_token, decoded_token, generation)
+    return decoded_token
+
+
+async def _verified_token(access_token: str) -> dict[str, Any]:
     """
     Verify the Firebase ID token once and require a verified email.
 
@@ -69,17 +87,11 @@ def _verified_token(access_token: str) -> dict[str, Any]:
     round-trip — and applies the same email-verification bar to every caller,
     admins included.
 
-    ``clock_skew_seconds`` tolerates a client whose clock runs slightly ahead
-    of Google's, which would otherwise reject a freshly minted token as
-    issued in the future.
-
     :raises HTTPException: 401 if the token is invalid/expired/revoked, 403 if
         the caller's email is not verified.
     """
     try:
-        decoded_token: dict[str, Any] = firebase_admin.auth.verify_id_token(
-            access_token, check_revoked=True, clock_skew_seconds=5
-        )
+        decoded_token = await _verify_id_token(access_token)
     except Exception as e:
         # The response deliberately says only "invalid or expired". Which of
         # revoked/expired/malformed it was belongs in the log, where it is the
@@ -151,7 +163,7 @@ def require_authorization_by_role(roles: set[str]) -> Callable[..., Awaitable[bo
     """
 
     async def check_role(access_token: str = Depends(get_access_token)) -> bool:
-        decoded_token = _verified_token(access_token)
+        decoded_token = await _verified_token(access_token)
 
         if decoded_token.get("role") not in roles:
             raise HTTPException(
@@ -181,7 +193,7 @@ async def require_self_driver_or_admin(
     resource silently unguarded.
     """
     driver_id = _path_uuid(request, "driver_id")
-    decoded_token = _verified_token(access_token)
+    decoded_token = await _verified_token(access_token)
 
     if decoded_token.get("role") == "admin":
         return DriverAccess.ADMIN
@@ -213,7 +225,7 @@ async def require_route_assigned_or_admin(
     resource silently unguarded.
     """
     route_id = _path_uuid(request, "route_id")
-    decoded_token = _verified_token(access_token)
+    decoded_token = await _verified_token(access_token)
 
     if decoded_token.get("role") == "admin":
         return True
@@ -253,7 +265,7 @@ async def require_announcement_owner_or_admin(
 ) -> bool:
     """Allow access if the caller is an admin or the announcement author."""
     announcement_id = _path_uuid(request, "announcement_id")
-    decoded_token = _verified_token(access_token)
+    decoded_token = await _verified_token(access_token)
 
     if decoded_token.get("role") == "admin":
         return True
@@ -319,7 +331,7 @@ async def resolve_route_list_driver_filter(
     Returns the driver_id to filter by, or ``None`` for "all routes" (admins
     only). ``email_verified`` is enforced for everyone, admins included.
     """
-    decoded_token = _verified_token(access_token)
+    decoded_token = await _verified_token(access_token)
     role = decoded_token.get("role")
 
     if role == "admin":
@@ -349,7 +361,7 @@ async def resolve_route_list_driver_filter(
     return own_driver_id
 
 
-def get_current_user_email(access_token: str = Depends(get_access_token)) -> str:
+async def get_current_user_email(access_token: str = Depends(get_access_token)) -> str:
     """
     Get the current user email from the access token
 
@@ -357,12 +369,10 @@ def get_current_user_email(access_token: str = Depends(get_access_token)) -> str
     :return: User email
     """
     try:
-        decoded_token: dict[str, Any] = firebase_admin.auth.verify_id_token(
-            access_token, check_revoked=True
-        )
+        decoded_token = await _verify_id_token(access_token)
         return str(decoded_token["email"])
     except Exception as e:
-        logger.error(f"Failed to decode access token: {e}")
+        logger.error("Failed to decode access token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         ) from e
@@ -380,9 +390,7 @@ async def get_current_database_user_id(
     :return: Database user ID (UUID)
     """
     try:
-        decoded_token: dict[str, Any] = firebase_admin.auth.verify_id_token(
-            access_token, check_revoked=True
-        )
+        decoded_token = await _verify_id_token(access_token)
         firebase_uid = decoded_token["uid"]
 
         # Convert Firebase UID to database driver ID
@@ -397,7 +405,7 @@ async def get_current_database_user_id(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get database user ID from access token: {e}")
+        logger.error("Failed to get database user ID from access token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         ) from e
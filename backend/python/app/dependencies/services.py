@@ -9,6 +9,15 @@ Convention:
   directly in the body. This keeps the dependency graph explicit and lets tests
   swap pieces via ``app.dependency_overrides``. See ``get_auth_service`` and
   ``get_location_service``.
+- Composite factories are ``async def`` so FastAPI resolves them on the event
+  loop instead of handing each one to the threadpool. They delegate to an
+  ``@lru_cache``d builder whose arguments are the cached leaf singletons, so
+  every request hits the same cache entry and reuses one instance instead of
+  rebuilding the service graph; a test that overrides a piece passes a
+  different argument and gets its own instance.
+- Leaf factories stay sync: ``lru_cache`` cannot cache a coroutine, and they
+  are also called directly outside request handling (at import, from the
+  lifespan, from other factories).
 """
 
 import logging
@@ -22,6 +31,7 @@ from app.services.implementations.auth_service import AuthService
 from app.services.implementations.driver_service import DriverService
 from app.services.implementations.email_dispatcher import EmailDispatcher
 from app.services.implementations.email_service import EmailService
+from app.services.implementations.job_service import JobService
 from app.services.implementations.location_group_service import LocationGroupService
 from app.services.implementations.location_service import LocationService
 from app.services.implementations.mock_routing_algorithm import (
@@ -89,7 +99,7 @@ def get_email_dispatcher() -> EmailDispatcher:
     )
 
 
-def get_email_dispatcher_depends() -> EmailDispatcher:
+async def get_email_dispatcher_depends() -> EmailDispatcher:
     """Get email dispatcher for dependency injection in route handlers"""
     return get_email_dispatcher()
 
@@ -122,14 +132,23 @@ def get_driver_service() -> DriverService:
     return DriverService(logger)
 
 
-def get_auth_service(
+@lru_cache
+def _build_auth_service(
+    user_service: UserService,
+    driver_service: DriverService,
+    email_service: EmailService,
+) -> AuthService:
+    logger = get_logger()
+    return AuthService(logger, user_service, driver_service, email_service)
+
+
+async def get_auth_service(
     user_service: UserService = Depends(get_user_service),
     driver_service: DriverService = Depends(get_driver_service),
     email_service: EmailService = Depends(get_email_service),
 ) -> AuthService:
     """Get auth service instance"""
-    logger = get_logger()
-    return AuthService(logger, user_service, driver_service, email_service)
+    return _build_auth_service(user_service, driver_service, email_service)
 
 
 @lru_cache
@@ -153,6 +172,13 @@ def get_route_group_service() -> RouteGroupService:
     return RouteGroupService(logger)
 
 
+@lru_cache
+def get_job_service() -> JobService:
+    """Get job service instance"""
+    logger = get_logger()
+    return JobService(logger)
+
+
 @lru_cache
 def get_routing_algorithm() -> RoutingAlgorithmProtocol:
     """Get routing algorithm instance (mock).
@@ -183,15 +209,23 @@ def get_system_settings_service() -> SystemSettingsService:
     return SystemSettingsService(logger, get_google_maps_client())
 
 
-def get_location_service(
+@lru_cache
+def _build_location_service(
+    google_maps_client: GoogleMapsClient,
+    system_settings_service: SystemSettingsService,
+) -> LocationService:
+    logger = get_logger()
+    return LocationService(logger, google_maps_client, system_settings_service)
+
+
+async def get_location_service(
     google_maps_client: GoogleMapsClient = Depends(get_google_maps_client),
     system_settings_service: SystemSettingsService = Depends(
         get_system_settings_service
     ),
 ) -> LocationService:
     """Get location service instance"""
-    logger = get_logger()
-    return LocationService(logger, google_maps_client, system_settings_service)
+    return _build_location_service(google_maps_client, system_settings_service)
 
 
 @lru_cache
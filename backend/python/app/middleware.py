@@ -1,17 +1,20 @@
-"""How a failed request becomes a response, wired up in :func:`app.create_app`.
+"""Middleware and handlers wired up in :func:`app.create_app`.
 
-Two paths, at opposite ends of the request: :class:`UnhandledExceptionMiddleware`
-catches what a route handler raised, and :func:`log_request_validation_error`
-catches what never reached one.
+How a failed request becomes a response takes two paths, at opposite ends of
+the request: :class:`UnhandledExceptionMiddleware` catches what a route handler
+raised, and :func:`log_request_validation_error` catches what never reached
+one. :class:`CredentialSafeGZipMiddleware` compresses everything else on the
+way out.
 """
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from fastapi import Request, status
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -76,6 +79,36 @@ class UnhandledExceptionMiddleware:
             await response(scope, receive, send)
 
 
+class CredentialSafeGZipMiddleware:
+    """Gzip responses, except those whose body carries a credential.
+
+    Compressing a secret alongside anything the caller can influence leaks the
+    secret through the compressed length (BREACH). The login, refresh and
+    registration bodies hold a Firebase ID token next to user fields and are
+    well over ``minimum_size``, so they are passed through uncompressed by
+    path; every other response goes through ``GZipMiddleware`` unchanged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: Iterable[str] = (),
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
+
+
 def _describe(errors: Sequence[Any]) -> str:
     """Render where each error is and what it is — never the value that caused it."""
     return "; ".join(
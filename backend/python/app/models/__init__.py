@@ -16,6 +16,18 @@ engine: Engine | None = None
 async_engine: AsyncEngine | None = None
 async_session_maker_instance: async_sessionmaker[AsyncSession] | None = None
 
+# Pool sizing for the application engine. SQLAlchemy's defaults (5 + 10
+# overflow) leave requests queueing for a connection once the scheduler's jobs
+# and a burst of route-list requests overlap. Connections are recycled well
+# before the hour so a server-side idle/lifetime cut never hands us a dead one
+# mid-request. If the pool is ever exhausted anyway, a request waits at most
+# a few seconds for a connection and then fails, instead of hanging for
+# SQLAlchemy's default 30 while more requests pile up behind it.
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 20
+DB_POOL_RECYCLE_SECONDS = 1800
+DB_POOL_TIMEOUT_SECONDS = 5
+
 
 def get_database_url() -> str:
     """Get database URL based on environment"""
@@ -63,7 +75,13 @@ def init_database() -> None:
 
     # Asynchronous engine for application
     async_engine = create_async_engine(
-        async_url, echo=echo_sql, connect_args=connect_args
+        async_url,
+        echo=echo_sql,
+        connect_args=connect_args,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
     )
 
     # Async session maker
@@ -1,7 +1,13 @@
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from pydantic import EmailStr, computed_field, field_validator, model_validator
+from pydantic import (
+    EmailStr,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 from sqlalchemy import JSON, Column
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -114,6 +120,11 @@ class DriverRead(DriverBase):
         return data
 
 
+# Validates a whole list of drivers in one pydantic-core call, rather than one
+# DriverRead.model_validate call per row from Python.
+DriverReadList: TypeAdapter[list[DriverRead]] = TypeAdapter(list[DriverRead])
+
+
 class DriverUpdate(SQLModel):
     first_name: str | None = Field(default=None, min_length=1, max_length=255)
     last_name: str | None = Field(default=None, min_length=1, max_length=255)
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 from sqlalchemy import JSON, Column, Text
 from sqlmodel import Field, SQLModel
 
@@ -55,6 +56,10 @@ class JobRead(JobBase):
     job_id: UUID
 
 
+# Validates a whole page of jobs in one pydantic-core call.
+JobReadList: TypeAdapter[list[JobRead]] = TypeAdapter(list[JobRead])
+
+
 class JobUpdate(SQLModel):
     """Job update request - all optional"""
 
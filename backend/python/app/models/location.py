@@ -3,7 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from pydantic import computed_field
+from pydantic import TypeAdapter, computed_field
 from sqlmodel import Field, Relationship, SQLModel, String
 
 from .base import BaseModel
@@ -276,6 +276,10 @@ class LocationRead(LocationBase):
         return LocationStatusEnum.INACTIVE
 
 
+# Validates a whole page of locations in one pydantic-core call.
+LocationReadList: TypeAdapter[list[LocationRead]] = TypeAdapter(list[LocationRead])
+
+
 class LocationUpdate(SQLModel):
     """Update request model with all fields optional"""
 
@@ -2,7 +2,7 @@ import hashlib
 from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import UUID, uuid4
 
-from pydantic import model_validator
+from pydantic import TypeAdapter, model_validator
 from sqlmodel import Field, Relationship, SQLModel
 
 from .base import BaseModel
@@ -76,6 +76,12 @@ class LocationGroupRead(LocationGroupBase):
     num_locations: int
 
 
+# Validates every location group in one pydantic-core call.
+LocationGroupReadList: TypeAdapter[list[LocationGroupRead]] = TypeAdapter(
+    list[LocationGroupRead]
+)
+
+
 class LocationGroupUpdate(SQLModel):
     """Location group update request - all optional"""
 
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
+from pydantic import TypeAdapter
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from .base import BaseModel
@@ -65,6 +66,10 @@ class NoteRead(NoteBase):
     updated_at: datetime | None = None
 
 
+# Validates a whole page of notes in one pydantic-core call.
+NoteReadList: TypeAdapter[list[NoteRead]] = TypeAdapter(list[NoteRead])
+
+
 class NoteFeedItem(NoteRead):
     """A location note with enough context for cross-location feeds."""
 
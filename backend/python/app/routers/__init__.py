@@ -18,21 +18,29 @@ from . import (
     upload_routes,
 )
 
+# Each router exactly once. A router included twice would register every one
+# of its routes twice, and ``_assert_unique_operation_ids`` in ``app`` refuses
+# to start if that happens.
+ROUTERS = (
+    admin_routes.router,
+    announcement_routes.router,
+    auth_routes.router,
+    driver_history_routes.router,
+    driver_routes.router,
+    location_group_routes.router,
+    route_group_routes.router,
+    route_routes.router,
+    location_routes.router,
+    note_chain_routes.router,
+    note_routes.router,
+    job_routes.router,
+    system_settings_routes.router,
+    upload_routes.router,
+    report_routes.router,
+)
+
 
 def init_app(app: FastAPI) -> None:
     """Initialize all routers with the FastAPI app"""
-    app.include_router(admin_routes.router)
-    app.include_router(announcement_routes.router)
-    app.include_router(auth_routes.router)
-    app.include_router(driver_history_routes.router)
-    app.include_router(driver_routes.router)
-    app.include_router(location_group_routes.router)
-    app.include_router(route_group_routes.router)
-    app.include_router(route_routes.router)
-    app.include_router(location_routes.router)
-    app.include_router(note_chain_routes.router)
-    app.include_router(note_routes.router)
-    app.include_router(job_routes.router)
-    app.include_router(system_settings_routes.router)
-    app.include_router(upload_routes.router)
-    app.include_router(report_routes.router)
+    for router in ROUTERS:
+        app.include_router(router)
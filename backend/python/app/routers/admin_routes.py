@@ -1,13 +1,6 @@
-import logging
-
 from fastapi import APIRouter, Depends
 
 from app.dependencies.auth import require_admin
-from app.services.implementations.driver_service import DriverService
-
-# Initialize service
-logger = logging.getLogger(__name__)
-driver_service = DriverService(logger)
 
 router = APIRouter(prefix="/admins", tags=["admins"])
 
@@ -1,8 +1,7 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.auth import (
@@ -10,18 +9,20 @@ from app.dependencies.auth import (
     require_admin,
     require_self_driver_or_admin,
 )
+from app.dependencies.services import get_driver_service
 from app.models import get_session
+from app.models.driver import DriverReadList
 from app.models.driver_mileage import (
     MAX_YEAR,
     MIN_YEAR,
     DriverHistoryRead,
     DriverHistorySummary,
 )
-from app.routers.driver_routes import get_drivers
 from app.services.implementations.driver_history_csv_service import (
     DriverHistoryCSVGenerator,
 )
 from app.services.implementations.driver_history_service import DriverHistoryService
+from app.services.implementations.driver_service import DriverService
 from app.utilities.csv_utils import generate_csv_from_list
 
 # Initialize service
@@ -46,13 +47,14 @@ async def get_driver_history_summary(
     return await driver_history_service.get_driver_history_summary(session, driver_id)
 
 
-@router.get("/{year}/export", response_class=StreamingResponse)
+@router.get("/{year}/export", response_class=Response)
 async def export_all_drivers_history(
     driver_id: str,
     year: int,
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     _auth: bool = Depends(require_admin),
-) -> StreamingResponse:
+) -> Response:
     """
     Export history for all drivers for a specific year. Includes data from that year and the previous year.
 
@@ -65,12 +67,10 @@ async def export_all_drivers_history(
             detail=f"Invalid driver_id: {driver_id}. Must be 'all' for year-based export",
         )
 
-    current_year_totals = await driver_history_service.get_yearly_totals_by_driver(
-        session, year
-    )
-    past_year_totals = await driver_history_service.get_yearly_totals_by_driver(
-        session, year - 1
-    )
+    (
+        current_year_totals,
+        past_year_totals,
+    ) = await driver_history_service.get_export_totals_by_driver(session, year)
 
     if not current_year_totals and not past_year_totals:
         raise HTTPException(
@@ -78,17 +78,29 @@ async def export_all_drivers_history(
             detail=f"No driver history found for year {year} or {year - 1}",
         )
 
-    driver_data = await get_drivers(session, driver_id=None, email=None)
+    # Only drivers with km in either year become rows, so only those are read
+    # and validated — the export's size follows the history, not the roster.
+    drivers = await driver_service.get_drivers_by_ids(
+        session, current_year_totals.keys() | past_year_totals.keys()
+    )
+    driver_data = DriverReadList.validate_python(drivers)
 
     generator = DriverHistoryCSVGenerator(
         current_year_totals, past_year_totals, driver_data
     )
 
     csv_data, filename = generator.generate_all_drivers_csv(year)
-    csv_output = generate_csv_from_list(csv_data, header=True)
+    # Every row has the same known columns, so name them up front instead of
+    # having the CSV writer scan each row's keys to discover the header.
+    csv_output = generate_csv_from_list(
+        csv_data, header=True, field=DriverHistoryCSVGenerator.columns(year)
+    )
 
-    return StreamingResponse(
-        iter([csv_output]),
+    # The CSV is already whole by this point — one row per driver — so it goes
+    # out as a plain body. Wrapping it in a one-chunk StreamingResponse only
+    # dropped the Content-Length and sent the iterator through the threadpool.
+    return Response(
+        content=csv_output,
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
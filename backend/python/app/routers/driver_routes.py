@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 from uuid import UUID
@@ -14,6 +15,7 @@ from app.dependencies.auth import (
 )
 from app.dependencies.services import (
     get_auth_service,
+    get_driver_service,
     get_email_dispatcher_depends,
     get_note_chain_service,
     get_user_invite_service,
@@ -23,6 +25,7 @@ from app.models import get_session
 from app.models.driver import (
     DriverCreate,
     DriverRead,
+    DriverReadList,
     DriverRegister,
     DriverUpdate,
 )
@@ -37,16 +40,19 @@ from app.services.implementations.user_invite_service import UserInviteService
 from app.services.implementations.user_service import UserService
 from app.utilities.cookies import set_refresh_token_cookie
 
-# Initialize service
 logger = logging.getLogger(__name__)
-driver_service = DriverService(logger)
 
 router = APIRouter(prefix="/drivers", tags=["drivers"])
 
+# The slices of a DriverRegister payload that become the User and the Driver.
+_USER_FIELDS = frozenset(UserBase.model_fields)
+_DRIVER_FIELDS = frozenset(DriverCreate.model_fields)
+
 
 @router.get("/", response_model=list[DriverRead])
 async def get_drivers(
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     driver_id: UUID | None = Query(None, description="Filter by driver ID"),
     email: str | None = Query(None, description="Filter by email"),
     _auth: bool = Depends(require_driver_or_admin),
@@ -80,13 +86,14 @@ async def get_drivers(
 
     else:
         drivers = await driver_service.get_drivers(session)
-        return [DriverRead.model_validate(driver) for driver in drivers]
+        return DriverReadList.validate_python(drivers)
 
 
 @router.get("/{driver_id}", response_model=DriverRead)
 async def get_driver(
     driver_id: UUID,
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     _auth: DriverAccess = Depends(require_self_driver_or_admin),
 ) -> DriverRead:
     """
@@ -107,6 +114,7 @@ async def get_driver(
 async def initialize_driver(
     register_request: DriverRegister,
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     email_dispatcher: EmailDispatcher = Depends(get_email_dispatcher_depends),
     user_service: UserService = Depends(get_user_service),
     user_invite_service: UserInviteService = Depends(get_user_invite_service),
@@ -117,20 +125,21 @@ async def initialize_driver(
     NOTE: This does not create a firebase user, ie the User is in a hanging state
     We need to do this so that we can implement our invite only system
     """
+    # Dump the payload once and split it, rather than walking it per model.
+    # Both halves were validated as part of DriverRegister, which carries the
+    # same field constraints, so the models are built without re-validating.
+    register_data = register_request.model_dump()
+
     async with session.begin_nested():
         # Create user first
-        user_data = register_request.model_dump(
-            include=set(UserBase.model_fields.keys())
-        )
-        user_base = UserBase(**user_data)
+        user_data = {k: v for k, v in register_data.items() if k in _USER_FIELDS}
+        user_base = UserBase.model_construct(**user_data)
         user = await user_service.create_user(session, user_base)
 
         # Create driver after
-        driver_data = register_request.model_dump(
-            include=set(DriverCreate.model_fields.keys())
-        )
+        driver_data = {k: v for k, v in register_data.items() if k in _DRIVER_FIELDS}
         driver_data["user_id"] = user.user_id
-        driver = DriverCreate(**driver_data)
+        driver = DriverCreate.model_construct(**driver_data)
         created_driver = await driver_service.create_driver(session, driver)
 
         # Create User Invite Record
@@ -200,12 +209,26 @@ async def complete_driver_registration(
 
         user_invite.is_used = True
 
-    await session.commit()
-
-    # Generate authentication tokens
-    auth_dto, refresh_token = await auth_service.generate_token(
-        session, user.email, registration_data.password, remember_me=False
+    # Signing in only needs the Firebase account created above, not the
+    # committed row, so the Firebase round-trip overlaps the commit instead of
+    # queuing behind it. The commit is always awaited to completion before the
+    # sign-in result is looked at: if the sign-in fails first, the session must
+    # not be torn down with the commit still in flight. A failed commit still
+    # fails the request, and the sign-in is abandoned. Its outcome is still
+    # retrieved, so a sign-in that fails despite the cancel is not logged by
+    # asyncio as "Task exception was never retrieved" with Firebase's details.
+    sign_in = asyncio.create_task(
+        auth_service.generate_token_for_user(
+            user, registration_data.password, remember_me=False
+        )
     )
+    try:
+        await session.commit()
+    except BaseException:
+        sign_in.cancel()
+        sign_in.add_done_callback(lambda task: task.cancelled() or task.exception())
+        raise
+    auth_dto, refresh_token = await sign_in
 
     # Set refresh token as httpOnly cookie
     set_refresh_token_cookie(response, refresh_token, remember_me=False)
@@ -220,6 +243,7 @@ async def update_driver(
     driver_id: UUID,
     driver: DriverUpdate,
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     access: DriverAccess = Depends(require_self_driver_or_admin),
 ) -> DriverRead:
     """
@@ -250,6 +274,7 @@ async def update_driver(
 async def delete_driver(
     driver_id: UUID,
     session: AsyncSession = Depends(get_session),
+    driver_service: DriverService = Depends(get_driver_service),
     user_service: UserService = Depends(get_user_service),
     note_chain_service: NoteChainService = Depends(get_note_chain_service),
     _auth: bool = Depends(require_admin),
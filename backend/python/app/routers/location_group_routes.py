@@ -25,8 +25,7 @@ async def get_location_groups(
     """
     Get all location groups
     """
-    location_groups = await location_group_service.get_location_groups(session)
-    return [LocationGroupRead.model_validate(lg) for lg in location_groups]
+    return await location_group_service.get_location_groups(session)
 
 
 @router.get("/{location_group_id}", response_model=LocationGroupRead)
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies.auth import get_current_database_user_id
 from app.dependencies.services import get_note_chain_service
 from app.models import get_session
-from app.models.note import NoteCreate, NoteRead, NoteUpdate
+from app.models.note import NoteCreate, NoteRead, NoteReadList, NoteUpdate
 from app.models.note_chain import NoteChainRead
 from app.services.implementations.note_chain_service import NoteChainService
 
@@ -82,7 +82,7 @@ async def get_notes(
             session, note_chain_id, current_user_id, limit, offset
         )
 
-        return [NoteRead.model_validate(note) for note in notes]
+        return NoteReadList.validate_python(notes)
     except ValueError as ve:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
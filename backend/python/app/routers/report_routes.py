@@ -88,10 +88,7 @@ async def get_monthly_totals(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid month"
         )
-    total_km = await service.get_total_km_for_month(session, year, month)
-    total_deliveries = await service.get_total_deliveries_for_month(
-        session, year, month
-    )
+    total_km, total_deliveries = await service.get_monthly_totals(session, year, month)
     return MonthlyTotalsResponse(
         year=year,
         month=month,
@@ -1,3 +1,4 @@
+import asyncio
 from logging import Logger
 from typing import TYPE_CHECKING
 
@@ -7,8 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.auth import AuthResponse
 from app.utilities.firebase_rest_client import FirebaseRestClient, FirebaseRestError
+from app.utilities.token_cache import verified_token_cache
 
 if TYPE_CHECKING:
+    from app.models.user import User
     from app.services.implementations.driver_service import DriverService
     from app.services.implementations.email_service import EmailService
     from app.services.implementations.user_service import UserService
@@ -39,6 +42,10 @@ REAUTH_REQUIRED_FIREBASE_CODES = frozenset(
 class AuthService:
     """
     AuthService implementation with user authentication methods
+
+    The Firebase REST client and ``firebase_admin`` are both synchronous HTTP
+    clients, so every call into them goes through ``asyncio.to_thread`` —
+    awaited inline they would hold the event loop for a full round-trip.
     """
 
     def __init__(
@@ -69,37 +76,66 @@ class AuthService:
     ) -> tuple[AuthResponse, str]:
         try:
             # Always attempt Firebase authentication first
-            token = self.firebase_rest_client.sign_in_with_password(email, password)
+            token = await asyncio.to_thread(
+                self.firebase_rest_client.sign_in_with_password, email, password
+            )
 
             # If Firebase auth succeeds, get user from database
             user = await self.user_service.get_user_by_email(session, email)
 
             if user is None:
                 self.logger.warning(
-                    f"Firebase user {email} exists but not found in database - potential data inconsistency"
+                    "Firebase user %s exists but not found in database - "
+                    "potential data inconsistency",
+                    email,
                 )
                 raise ValueError("Invalid email or password")
 
-            # Create AuthResponse with all required fields (refresh_token excluded - it goes in httpOnly cookie)
-            auth_response = AuthResponse(
-                access_token=token.access_token,
-                id=user.user_id,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                email=user.email,
-                role=user.role,
-                remember_me=remember_me,
-            )
+            auth_response = self._auth_response(user, token.access_token, remember_me)
             return auth_response, token.refresh_token
         except Exception as e:
             # Log the actual error for debugging but return generic message to client
-            self.logger.error(f"Authentication failed for email {email}: {e!s}")
+            self.logger.error("Authentication failed for email %s: %s", email, e)
             # Always return the same generic error message to prevent enumeration
             raise ValueError("Invalid email or password") from e
 
+    async def generate_token_for_user(
+        self, user: "User", password: str, remember_me: bool
+    ) -> tuple[AuthResponse, str]:
+        """Sign in a user the caller already holds, without re-reading it.
+
+        For flows that have just created or loaded ``user`` themselves (e.g.
+        driver registration): ``generate_token`` would look the same row up by
+        email again, plus the driver row for a non-admin. Unlike
+        ``generate_token``, failures are not masked — there is no enumeration
+        to protect against when the caller already has the user.
+        """
+        token = await asyncio.to_thread(
+            self.firebase_rest_client.sign_in_with_password, user.email, password
+        )
+        auth_response = self._auth_response(user, token.access_token, remember_me)
+        return auth_response, token.refresh_token
+
+    @staticmethod
+    def _auth_response(
+        user: "User", access_token: str, remember_me: bool
+    ) -> AuthResponse:
+        # The refresh token is deliberately not part of the response body — it
+        # goes in an httpOnly cookie.
+        return AuthResponse(
+            access_token=access_token,
+            id=user.user_id,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            role=user.role,
+            remember_me=remember_me,
+        )
+
     async def revoke_tokens(self, auth_id: str) -> None:
         try:
-            firebase_admin.auth.revoke_refresh_tokens(auth_id)
+            await asyncio.to_thread(firebase_admin.auth.revoke_refresh_tokens, auth_id)
+            verified_token_cache.invalidate_uid(auth_id)
         except Exception as e:
             reason = getattr(e, "message", None)
             error_message = [
@@ -112,7 +148,9 @@ class AuthService:
 
     async def revoke_tokens_by_refresh_token(self, refresh_token: str) -> None:
         try:
-            token_response = self.firebase_rest_client.refresh_token(refresh_token)
+            token_response = await asyncio.to_thread(
+                self.firebase_rest_client.refresh_token, refresh_token
+            )
             new_access_token = token_response.access_token
             payload = jwt.decode(
                 new_access_token,
@@ -123,9 +161,7 @@ class AuthService:
             if auth_id:
                 await self.revoke_tokens(auth_id)
         except Exception as e:
-            self.logger.error(
-                f"Failed to revoke refresh tokens by refresh token: {e!s}"
-            )
+            self.logger.error("Failed to revoke refresh tokens by refresh token: %s", e)
             raise e
 
     async def renew_token(
@@ -138,7 +174,9 @@ class AuthService:
             longer in our database. Both mean the client must log in again.
         """
         try:
-            token_response = self.firebase_rest_client.refresh_token(refresh_token)
+            token_response = await asyncio.to_thread(
+                self.firebase_rest_client.refresh_token, refresh_token
+            )
         except FirebaseRestError as e:
             if e.code in REAUTH_REQUIRED_FIREBASE_CODES:
                 raise SessionExpiredError(
@@ -160,13 +198,5 @@ class AuthService:
                 f"No user in the database for Firebase auth_id {auth_id}"
             )
 
-        auth_response = AuthResponse(
-            access_token=new_access_token,
-            id=user.user_id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            email=user.email,
-            role=user.role,
-            remember_me=remember_me,
-        )
+        auth_response = self._auth_response(user, new_access_token, remember_me)
         return auth_response, token_response.refresh_token
@@ -19,6 +19,17 @@ class DriverHistoryCSVGenerator:
         self.past_year_totals = past_year_totals
         self.driver_data = driver_data
 
+    @staticmethod
+    def columns(year: int) -> list[str]:
+        """The export's header row for ``year``, in column order."""
+        return [
+            "first",
+            "last",
+            "email",
+            f"distance (km) in {year}",
+            f"distance (km) in {year - 1}",
+        ]
+
     def generate_all_drivers_csv(self, year: int) -> tuple[list[dict[str, Any]], str]:
         """Generate CSV data for all drivers for a given year.
 
@@ -27,6 +38,9 @@ class DriverHistoryCSVGenerator:
         first name; drivers with only previous-year km follow, sorted the
         same way.
         """
+        # The year columns are named once here rather than re-formatted for
+        # every row and again for every sort-key lookup.
+        first_col, last_col, email_col, current_col, past_col = self.columns(year)
 
         all_driver_ids = set(self.current_year_totals) | set(self.past_year_totals)
 
@@ -40,15 +54,11 @@ class DriverHistoryCSVGenerator:
             driver = driver_lookup[driver_id]
             csv_data.append(
                 {
-                    "first": driver.first_name,
-                    "last": driver.last_name,
-                    "email": driver.email,
-                    f"distance (km) in {year}": self.current_year_totals.get(
-                        driver_id, 0
-                    ),
-                    f"distance (km) in {year - 1}": self.past_year_totals.get(
-                        driver_id, 0
-                    ),
+                    first_col: driver.first_name,
+                    last_col: driver.last_name,
+                    email_col: driver.email,
+                    current_col: self.current_year_totals.get(driver_id, 0),
+                    past_col: self.past_year_totals.get(driver_id, 0),
                 }
             )
 
@@ -61,11 +71,9 @@ class DriverHistoryCSVGenerator:
         # Sort: current year drivers first, then last name, then first name.
         csv_data.sort(
             key=lambda x: (
-                not x[
-                    f"distance (km) in {year}"
-                ],  # current year drivers first, no people with 0 km
-                str(x["last"]).lower(),
-                str(x["first"]).lower(),
+                not x[current_col],  # current year drivers first, no people with 0 km
+                str(x[last_col]).lower(),
+                str(x[first_col]).lower(),
             )
         )
 
@@ -138,7 +138,11 @@ class DriverHistoryService:
     async def get_yearly_totals_by_driver(
         self, session: AsyncSession, year: int
     ) -> dict[UUID, float]:
-        """Per-driver km totals for one year (powers the CSV export)."""
+        """Per-driver km totals for one year.
+
+        The CSV export reads two years at once through
+        ``get_export_totals_by_driver``, which must agree with this per year.
+        """
         try:
             events = mileage_events(bounds=month_bounds(year))
             statement = select(
@@ -151,6 +155,36 @@ class DriverHistoryService:
             self.logger.error(f"Failed to get yearly totals: {e!s}")
             raise e
 
+    async def get_export_totals_by_driver(
+        self, session: AsyncSession, year: int
+    ) -> tuple[dict[UUID, float], dict[UUID, float]]:
+        """Per-driver km totals for ``year`` and ``year - 1``, in one query.
+
+        The CSV export needs both years side by side. Grouping by year over
+        the two-year range answers it in a single round-trip instead of one
+        ``get_yearly_totals_by_driver`` call per year.
+        """
+        try:
+            events = mileage_events(
+                bounds=(month_bounds(year - 1)[0], month_bounds(year)[1])
+            )
+            statement = select(
+                events.c.driver_id,
+                events.c.year,
+                func.sum(events.c.km).label("km"),
+            ).group_by(events.c.driver_id, events.c.year)
+            result = await session.execute(statement)
+
+            current: dict[UUID, float] = {}
+            previous: dict[UUID, float] = {}
+            for row in result.all():
+                totals = current if int(row.year) == year else previous
+                totals[row.driver_id] = float(row.km)
+            return current, previous
+        except Exception as e:
+            self.logger.error(f"Failed to get export totals: {e!s}")
+            raise e
+
     async def get_driver_history_summary(
         self, session: AsyncSession, driver_id: UUID
     ) -> DriverHistorySummary:
@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from app.config import settings
 from app.models.driver import Driver
@@ -57,19 +58,65 @@ class DriverReportService:
             self.logger.exception("Failed to compute monthly km ranking")
             raise
 
-    async def get_total_km_for_month(
+    async def get_monthly_totals(
         self, session: AsyncSession, year: int, month: int
-    ) -> float:
+    ) -> tuple[float, int]:
+        """Return (total km, total deliveries) for the given year/month.
+
+        Both aggregates go out as scalar subqueries of one statement, so the
+        totals cost a single round-trip rather than one per figure.
+        """
         try:
             events = mileage_events(bounds=month_bounds(year, month))
-            statement = select(func.coalesce(func.sum(events.c.km), 0.0))
-            result = await session.execute(statement)
-            total = result.scalar_one()
-            return float(total or 0.0)
+            total_km = select(
+                func.coalesce(func.sum(events.c.km), 0.0)
+            ).scalar_subquery()
+
+            # Build month boundaries in scheduler timezone and pass them through
+            start = datetime(year, month, 1, 0, 0, tzinfo=self.timezone)
+            if month == 12:
+                end = datetime(year + 1, 1, 1, 0, 0, tzinfo=self.timezone)
+            else:
+                end = datetime(year, month + 1, 1, 0, 0, tzinfo=self.timezone)
+            total_deliveries = self._deliveries_between_statement(
+                start, end
+            ).scalar_subquery()
+
+            result = await session.execute(select(total_km, total_deliveries))
+            km, deliveries = result.one()
+            return float(km or 0.0), int(deliveries or 0)
         except Exception:
-            self.logger.exception("Failed to compute total km for month")
+            self.logger.exception("Failed to compute monthly totals")
             raise
 
+    def _deliveries_between_statement(
+        self, start_dt: datetime, end_dt: datetime
+    ) -> SelectOfScalar[int]:
+        """The delivery-count statement behind ``get_total_deliveries_between``."""
+        # Land in the scheduler timezone before taking the calendar day —
+        # the same instant is a different date either side of midnight.
+        if start_dt.tzinfo is not None:
+            start_dt = start_dt.astimezone(self.timezone)
+        if end_dt.tzinfo is not None:
+            end_dt = end_dt.astimezone(self.timezone)
+
+        start_d = start_dt.date()
+        end_d = end_dt.date()
+
+        # Join route_stop_snapshots -> route_stops -> routes -> route_groups
+        from app.models.route import Route
+        from app.models.route_stop import RouteStop
+
+        # Use model-based joins so sqlalchemy resolves FK-based ON clauses
+        return (
+            select(func.count())
+            .select_from(RouteStopSnapshot)
+            .join(RouteStop)
+            .join(Route)
+            .join(RouteGroup)
+            .where(RouteGroup.drive_date >= start_d, RouteGroup.drive_date <= end_d)
+        )
+
     async def get_total_deliveries_between(
         self, session: AsyncSession, start_dt: datetime, end_dt: datetime
     ) -> int:
@@ -78,45 +125,10 @@ class DriverReportService:
         start_dt and end_dt should be timezone-aware datetimes.
         """
         try:
-            # Land in the scheduler timezone before taking the calendar day —
-            # the same instant is a different date either side of midnight.
-            if start_dt.tzinfo is not None:
-                start_dt = start_dt.astimezone(self.timezone)
-            if end_dt.tzinfo is not None:
-                end_dt = end_dt.astimezone(self.timezone)
-
-            start_d = start_dt.date()
-            end_d = end_dt.date()
-
-            # Join route_stop_snapshots -> route_stops -> routes -> route_groups
-            from app.models.route import Route
-            from app.models.route_stop import RouteStop
-
-            # Use model-based joins so sqlalchemy resolves FK-based ON clauses
-            stmt = (
-                select(func.count())
-                .select_from(RouteStopSnapshot)
-                .join(RouteStop)
-                .join(Route)
-                .join(RouteGroup)
-                .where(RouteGroup.drive_date >= start_d, RouteGroup.drive_date <= end_d)
-            )
-
+            stmt = self._deliveries_between_statement(start_dt, end_dt)
             result = await session.execute(stmt)
             count = result.scalar_one()
             return int(count or 0)
         except Exception:
             self.logger.exception("Failed to count deliveries between dates")
             raise
-
-    async def get_total_deliveries_for_month(
-        self, session: AsyncSession, year: int, month: int
-    ) -> int:
-        # Build month boundaries in scheduler timezone and pass them through
-        start = datetime(year, month, 1, 0, 0, tzinfo=self.timezone)
-        if month == 12:
-            end = datetime(year + 1, 1, 1, 0, 0, tzinfo=self.timezone)
-        else:
-            end = datetime(year, month + 1, 1, 0, 0, tzinfo=self.timezone)
-
-        return await self.get_total_deliveries_between(session, start, end)
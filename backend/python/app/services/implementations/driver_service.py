@@ -1,10 +1,12 @@
+import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any, ClassVar
 from uuid import UUID
 
 import firebase_admin.auth
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 from sqlmodel import select
 
 from app.models.driver import Driver, DriverCreate, DriverUpdate
@@ -48,10 +50,12 @@ class DriverService:
     ) -> Driver | None:
         """Get driver by email using Firebase"""
         try:
+            # The user row is already joined in for the filter, so fill
+            # Driver.user from it rather than fetching it again.
             statement = (
                 select(Driver)
-                .options(selectinload(Driver.user))  # type: ignore[arg-type]
                 .join(Driver.user)  # type: ignore[arg-type]
+                .options(contains_eager(Driver.user))  # type: ignore[arg-type]
                 .where(User.email == email)
             )
             result = await session.execute(statement)
@@ -74,8 +78,8 @@ class DriverService:
         try:
             statement = (
                 select(Driver)
-                .options(selectinload(Driver.user))  # type: ignore[arg-type]
                 .join(Driver.user)  # type: ignore[arg-type]
+                .options(contains_eager(Driver.user))  # type: ignore[arg-type]
                 .where(User.auth_id == auth_id)
             )
             result = await session.execute(statement)
@@ -100,6 +104,25 @@ class DriverService:
             self.logger.error(f"Failed to get drivers: {e!s}")
             raise e
 
+    async def get_drivers_by_ids(
+        self, session: AsyncSession, driver_ids: Iterable[UUID]
+    ) -> list[Driver]:
+        """Get the drivers with the given IDs - returns SQLModel instances
+
+        IDs with no driver are skipped, so the result may be shorter.
+        """
+        try:
+            statement = (
+                select(Driver)
+                .options(selectinload(Driver.user))  # type: ignore[arg-type]
+                .where(Driver.driver_id.in_(list(driver_ids)))  # type: ignore[attr-defined]
+            )
+            result = await session.execute(statement)
+            return list(result.scalars().all())
+        except Exception as e:
+            self.logger.error(f"Failed to get drivers by ids: {e!s}")
+            raise e
+
     async def create_driver(
         self,
         session: AsyncSession,
@@ -168,11 +191,13 @@ class DriverService:
                 self.USER_UPDATE_FIELDS.intersection(update_data)
                 and driver.user.auth_id is not None
             ):
-                firebase_admin.auth.update_user(
+                await asyncio.to_thread(
+                    firebase_admin.auth.update_user,
                     driver.user.auth_id,
                     display_name=driver.user.full_name,
                 )
-                firebase_admin.auth.set_custom_user_claims(
+                await asyncio.to_thread(
+                    firebase_admin.auth.set_custom_user_claims,
                     driver.user.auth_id,
                     {
                         "role": driver.user.role,
@@ -221,20 +246,21 @@ class DriverService:
     ) -> UUID | None:
         """Get driver_id by auth_id"""
         try:
+            # Runs on every self-or-admin authorization check, so it selects
+            # only the id instead of loading the driver and its user.
             statement = (
-                select(Driver)
-                .options(selectinload(Driver.user))  # type: ignore[arg-type]
+                select(Driver.driver_id)
                 .join(Driver.user)  # type: ignore[arg-type]
                 .where(User.auth_id == auth_id)
             )
             result = await session.execute(statement)
-            driver = result.scalars().first()
+            driver_id = result.scalars().first()
 
-            if not driver:
+            if not driver_id:
                 self.logger.error(f"Driver with auth_id {auth_id} not found")
                 return None
 
-            return driver.driver_id
+            return driver_id
         except Exception as e:
             self.logger.error(f"Failed to get driver_id by auth_id: {e!s}")
             raise e
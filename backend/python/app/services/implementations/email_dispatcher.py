@@ -4,6 +4,7 @@ Used to send both event-driven and scheduled emails
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from app.constants.email_config import EMAIL_TEMPLATES, validate_email_context
@@ -61,11 +62,8 @@ class EmailDispatcher:
         # Render template with context
         try:
             html_body = self.template_renderer.render(template_name, context)
-        except Exception as e:
-            self.logger.error(
-                f"Failed to render template for {email_type}: {e!s}",
-                exc_info=True,
-            )
+        except Exception:
+            self.logger.exception("Failed to render template for %s", email_type)
             raise
 
         # Normalize recipients to concrete list
@@ -75,23 +73,28 @@ class EmailDispatcher:
         failures: list[tuple[str, Exception]] = []
         for recipient_email in recipients:
             try:
-                self.email_service.send_email(
+                # The Gmail client is synchronous; keep its round-trip off
+                # the event loop.
+                await asyncio.to_thread(
+                    self.email_service.send_email,
                     to=recipient_email,
                     subject=subject_str,
                     body=html_body,
                 )
-                self.logger.info(f"Sent {email_type} email to {recipient_email}")
+                self.logger.info("Sent %s email to %s", email_type, recipient_email)
             except Exception as e:
-                self.logger.error(
-                    f"Failed to send {email_type} email to {recipient_email}: {e!s}",
-                    exc_info=True,
+                self.logger.exception(
+                    "Failed to send %s email to %s", email_type, recipient_email
                 )
                 failures.append((recipient_email, e))
 
         if failures:
             failed_addresses = [addr for addr, _ in failures]
             self.logger.error(
-                f"Failed to send {email_type} email to {len(failures)} recipients: {failed_addresses}"
+                "Failed to send %s email to %d recipients: %s",
+                email_type,
+                len(failures),
+                failed_addresses,
             )
             raise RuntimeError(
                 f"Failed to send {email_type} email to {len(failures)} recipients: {failed_addresses}"
@@ -3,7 +3,9 @@ import logging
 from email.mime.text import MIMEText
 from typing import Any
 
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
 # Type alias for Gmail API message body
@@ -36,8 +38,8 @@ class EmailService:
         :type display_name: str, optional
         """
         self.logger = logger
-        creds = Credentials(None, **credentials)
-        self.service: Any = build("gmail", "v1", credentials=creds)
+        self.credentials = Credentials(None, **credentials)
+        self.service: Any = build("gmail", "v1", credentials=self.credentials)
         self.sender_email = sender_email
         if display_name:
             self.sender = f"{display_name} <{sender_email}>"
@@ -53,11 +55,15 @@ class EmailService:
             "raw": base64.urlsafe_b64encode(message.as_string().encode()).decode()
         }
         try:
+            # One EmailService is shared process-wide and send_email runs on
+            # worker threads, so sends can overlap. The client's own
+            # httplib2.Http is not thread-safe, so each send gets its own.
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
             sent_info = (
                 self.service.users()
                 .messages()
                 .send(userId=self.sender_email, body=email)
-                .execute()
+                .execute(http=http)
             )
             return dict(sent_info)
         except Exception as e:
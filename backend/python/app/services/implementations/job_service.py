@@ -27,22 +27,25 @@ TERMINAL_PROGRESS_STATES = frozenset(
 class JobService:
     """Service for managing route generation jobs and their progress"""
 
-    def __init__(self, logger: logging.Logger, session: AsyncSession):
+    def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.session = session
 
-    async def get_jobs(self, progress: ProgressEnum | None = None) -> list[Job]:
+    async def get_jobs(
+        self, session: AsyncSession, progress: ProgressEnum | None = None
+    ) -> list[Job]:
         """Get all jobs - optionally filtered by progress."""
         statement = select(Job)
         if progress:
             statement = statement.where(Job.progress == progress)
-        result = await self.session.execute(statement)
+        result = await session.execute(statement)
         return list(result.scalars().all())
 
     def est_now_naive(self) -> datetime:
         return datetime.now(ZoneInfo("America/New_York")).replace(tzinfo=None)
 
-    async def generate_job(self, req: RouteGenerationGroupInput | None = None) -> UUID:
+    async def generate_job(
+        self, session: AsyncSession, req: RouteGenerationGroupInput | None = None
+    ) -> UUID:
         """Create a job, persisting the generation request for a worker to run later.
 
         The request is stored as JSON on `input_payload` rather than acted on
@@ -53,21 +56,23 @@ class JobService:
                 progress=ProgressEnum.PENDING,
                 input_payload=req.model_dump(mode="json") if req is not None else None,
             )
-            self.session.add(job)
-            await self.session.commit()
-            await self.session.refresh(job)
+            session.add(job)
+            await session.commit()
+            await session.refresh(job)
             return job.job_id
         except Exception as error:
             self.logger.error("Error creating job")
-            await self.session.rollback()
+            await session.rollback()
             raise error
 
-    async def get_job(self, job_id: UUID) -> Job | None:
+    async def get_job(self, session: AsyncSession, job_id: UUID) -> Job | None:
         """Get a job by job ID"""
-        result = await self.session.execute(select(Job).where(Job.job_id == job_id))
+        result = await session.execute(select(Job).where(Job.job_id == job_id))
         return result.scalar_one_or_none()
 
-    async def update_progress(self, job_id: UUID, progress: ProgressEnum) -> None:
+    async def update_progress(
+        self, session: AsyncSession, job_id: UUID, progress: ProgressEnum
+    ) -> None:
         try:
             now = self.est_now_naive()
             values = {
@@ -79,18 +84,18 @@ class JobService:
 
             result = cast(
                 "CursorResult[Any]",
-                await self.session.execute(
+                await session.execute(
                     update(Job)
                     .where(col(Job.job_id) == job_id)
                     .where(col(Job.progress) != ProgressEnum.CANCELLED)
                     .values(**values)
                 ),
             )
-            await self.session.commit()
+            await session.commit()
             if result.rowcount:
                 return
 
-            job = await self.get_job(job_id)
+            job = await self.get_job(session, job_id)
             if not job:
                 self.logger.error("Job %s not found during progress update", job_id)
                 return
@@ -103,10 +108,10 @@ class JobService:
                 return
         except Exception as error:
             self.logger.error("Error updating job %s progress", job_id)
-            await self.session.rollback()
+            await session.rollback()
             raise error
 
-    async def cancel_job(self, job_id: UUID) -> Job | None:
+    async def cancel_job(self, session: AsyncSession, job_id: UUID) -> Job | None:
         """Cancel pending/running route generation work.
 
         Completed, failed, and already-cancelled jobs are treated as safe
@@ -116,7 +121,7 @@ class JobService:
             now = self.est_now_naive()
             result = cast(
                 "CursorResult[Any]",
-                await self.session.execute(
+                await session.execute(
                     update(Job)
                     .where(col(Job.job_id) == job_id)
                     .where(col(Job.progress).not_in(TERMINAL_PROGRESS_STATES))
@@ -127,9 +132,9 @@ class JobService:
                     )
                 ),
             )
-            await self.session.commit()
+            await session.commit()
 
-            job = await self.get_job(job_id)
+            job = await self.get_job(session, job_id)
             if not job:
                 self.logger.error("Job %s not found during cancellation", job_id)
                 return None
@@ -143,12 +148,12 @@ class JobService:
             return job
         except Exception as error:
             self.logger.error("Error cancelling job %s", job_id)
-            await self.session.rollback()
+            await session.rollback()
             raise error
 
-    async def enqueue(self, job_id: UUID) -> None:
+    async def enqueue(self, session: AsyncSession, job_id: UUID) -> None:
         try:
-            job = await self.get_job(job_id)
+            job = await self.get_job(session, job_id)
 
             if not job:
                 self.logger.error("Job %s not found during enqueue", job_id)
@@ -164,11 +169,11 @@ class JobService:
 
             job.progress = ProgressEnum.RUNNING
             job.started_at = self.est_now_naive()
-            self.session.add(job)
-            await self.session.commit()
+            session.add(job)
+            await session.commit()
         except Exception:
             self.logger.exception("Enqueue failed for job %s", job_id)
             try:
-                await self.update_progress(job_id, ProgressEnum.FAILED)
+                await self.update_progress(session, job_id, ProgressEnum.FAILED)
             except Exception:
                 self.logger.exception("Failed to mark job %s as FAILED", job_id)
@@ -1,6 +1,7 @@
 import logging
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
@@ -9,6 +10,8 @@ from app.models.location import Location
 from app.models.location_group import (
     LocationGroup,
     LocationGroupCreate,
+    LocationGroupRead,
+    LocationGroupReadList,
     LocationGroupUpdate,
 )
 
@@ -17,16 +20,29 @@ class LocationGroupService:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
-    async def get_location_groups(self, session: AsyncSession) -> list[LocationGroup]:
+    async def get_location_groups(
+        self, session: AsyncSession
+    ) -> list[LocationGroupRead]:
         """Get all location groups"""
         try:
-            # Eager-load locations so LocationGroupRead.num_locations can be read
-            # without triggering an (illegal) lazy load on the async session.
-            statement = select(LocationGroup).options(
-                selectinload(LocationGroup.locations)  # type: ignore[arg-type]
+            # Count each group's locations in SQL rather than loading every
+            # location row just to take len() of the relationship.
+            num_locations = (
+                select(func.count())
+                .select_from(Location)
+                .where(Location.location_group_id == LocationGroup.location_group_id)
+                .correlate(LocationGroup)
+                .scalar_subquery()
+                .label("num_locations")
             )
+            statement = select(LocationGroup, num_locations)
             result = await session.execute(statement)
-            return list(result.scalars().all())
+            return LocationGroupReadList.validate_python(
+                [
+                    {**group.model_dump(), "num_locations": count}
+                    for group, count in result.all()
+                ]
+            )
         except Exception as error:
             self.logger.error(f"Failed to get location groups: {error!s}")
             raise error
@@ -36,6 +36,7 @@ from app.models.location import (
     LocationImportResult,
     LocationImportRow,
     LocationRead,
+    LocationReadList,
     LocationUpdate,
     NetNewEntry,
     StaleEntry,
@@ -287,21 +288,23 @@ class LocationService:
             latest_notes = await self.load_latest_notes(
                 session, (loc.note_chain_id for loc in items)
             )
-            reads = [
-                self._to_read(
-                    loc,
-                    has_future_route=loc.location_id in future_set,
-                    assigned_route=assigned.get(loc.location_id),
-                    last_delivery_date=aggregates.get(loc.location_id, (0, None))[1],
-                    total_deliveries=aggregates.get(loc.location_id, (0, None))[0],
+            # Validate the page in one call rather than through _to_read row by
+            # row, then fill in the derived fields the same way it does.
+            reads = LocationReadList.validate_python(items)
+            for read in reads:
+                deliveries, last_date = aggregates.get(read.location_id, (0, None))
+                self._fill_derived(
+                    read,
+                    has_future_route=read.location_id in future_set,
+                    assigned_route=assigned.get(read.location_id),
+                    last_delivery_date=last_date,
+                    total_deliveries=deliveries,
                     latest_note=(
-                        latest_notes.get(loc.note_chain_id)
-                        if loc.note_chain_id
+                        latest_notes.get(read.note_chain_id)
+                        if read.note_chain_id
                         else None
                     ),
                 )
-                for loc in items
-            ]
             return PaginatedResponse.create(
                 items=reads,
                 total=total,
@@ -472,7 +475,29 @@ class LocationService:
         Status is then a @computed_field on LocationRead; no separate work
         needed at the service layer.
         """
-        read = LocationRead.model_validate(loc, from_attributes=True)
+        return self._fill_derived(
+            LocationRead.model_validate(loc, from_attributes=True),
+            has_future_route=has_future_route,
+            assigned_route=assigned_route,
+            last_delivery_date=last_delivery_date,
+            total_deliveries=total_deliveries,
+            latest_note=latest_note,
+        )
+
+    @staticmethod
+    def _fill_derived(
+        read: LocationRead,
+        has_future_route: bool,
+        assigned_route: str | None = None,
+        last_delivery_date: datetime | None = None,
+        total_deliveries: int = 0,
+        latest_note: str | None = None,
+    ) -> LocationRead:
+        """Set the fields a LocationRead derives from other tables.
+
+        The one place they are assigned, whether the read was validated alone
+        by _to_read or as part of a page.
+        """
         read.has_future_route = has_future_route
         read.assigned_route = assigned_route
         read.last_delivery_date = last_delivery_date
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -9,6 +10,7 @@ from sqlmodel import select
 
 from app.models.driver import Driver
 from app.models.user import User, UserBase, UserUpdate
+from app.utilities.token_cache import verified_token_cache
 
 if TYPE_CHECKING:
     from firebase_admin.auth import UserRecord
@@ -115,14 +117,17 @@ class UserService:
 
         try:
             # Create Firebase user and set role
-            firebase_user = firebase_admin.auth.create_user(
+            created: UserRecord = await asyncio.to_thread(
+                firebase_admin.auth.create_user,
                 email=user.email,
                 password=password,
                 email_verified=True,
                 display_name=user.full_name,
             )
-            firebase_admin.auth.set_custom_user_claims(
-                firebase_user.uid,
+            firebase_user = created
+            await asyncio.to_thread(
+                firebase_admin.auth.set_custom_user_claims,
+                created.uid,
                 {
                     "role": user.role,
                     "given_name": user.first_name,
@@ -131,7 +136,7 @@ class UserService:
             )
 
             # Update user
-            user.auth_id = firebase_user.uid
+            user.auth_id = created.uid
 
             await session.flush()
             return user
@@ -140,7 +145,9 @@ class UserService:
             # Rollback Firebase user creation
             if firebase_user:
                 try:
-                    firebase_admin.auth.delete_user(firebase_user.uid)
+                    await asyncio.to_thread(
+                        firebase_admin.auth.delete_user, firebase_user.uid
+                    )
                 except Exception as firebase_error:
                     self.logger.error(
                         f"Failed to rollback Firebase user: {firebase_error!s}"
@@ -183,9 +190,14 @@ class UserService:
                 if user_data.first_name is not None or user_data.last_name is not None:
                     firebase_updates["display_name"] = user.full_name
                 if firebase_updates:
-                    firebase_admin.auth.update_user(user.auth_id, **firebase_updates)
+                    await asyncio.to_thread(
+                        firebase_admin.auth.update_user,
+                        user.auth_id,
+                        **firebase_updates,
+                    )
                 if user_data.first_name is not None or user_data.last_name is not None:
-                    firebase_admin.auth.set_custom_user_claims(
+                    await asyncio.to_thread(
+                        firebase_admin.auth.set_custom_user_claims,
                         user.auth_id,
                         {
                             "role": user.role,
@@ -239,7 +251,8 @@ class UserService:
             # Delete from Firebase before committing — if this fails,
             # the outer handler rolls back the pending DB delete.
             if auth_id:
-                firebase_admin.auth.delete_user(auth_id)
+                await asyncio.to_thread(firebase_admin.auth.delete_user, auth_id)
+                verified_token_cache.invalidate_uid(auth_id)
 
             await session.commit()
 
@@ -286,7 +299,11 @@ class UserService:
 
     async def update_password(self, auth_id: str, new_password: str) -> None:
         try:
-            firebase_admin.auth.update_user(auth_id, password=new_password)
+            await asyncio.to_thread(
+                firebase_admin.auth.update_user, auth_id, password=new_password
+            )
+            # A password change revokes the user's sessions in Firebase.
+            verified_token_cache.invalidate_uid(auth_id)
         except firebase_admin.auth.UserNotFoundError as e:
             self.logger.error(f"Firebase user {auth_id} not found: {e!s}")
             raise e
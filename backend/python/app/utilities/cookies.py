@@ -1,4 +1,5 @@
-from typing import Literal, cast
+import re
+from typing import Literal
 
 from fastapi import Response
 
@@ -7,17 +8,56 @@ from app.config import settings
 # Refresh tokens last 30 days
 REFRESH_TOKEN_MAX_AGE = 30 * 24 * 60 * 60
 
+# Cookie attributes depend only on the deploy environment, which is fixed for
+# the life of the process — resolve them once rather than on every auth call.
+COOKIE_SAMESITE: Literal["none", "strict", "lax"] = (
+    "none" if settings.preview_deploy else "strict"
+)
+COOKIE_SECURE: bool = settings.is_production
 
-def get_cookie_options() -> dict[str, bool | Literal["none", "strict", "lax"]]:
-    """Get cookie options based on environment"""
-    samesite: Literal["none", "strict", "lax"] = (
-        "none" if settings.preview_deploy else "strict"
+AUTH_COOKIE_KEYS = ("refreshToken", "rememberMe")
+
+# Only the value and Max-Age vary between responses, so the header is
+# assembled by hand instead of through ``Response.set_cookie``, which builds
+# and serializes a ``SimpleCookie`` per call. Attribute order and spelling
+# match what ``set_cookie`` emits.
+_COOKIE_TAIL = f"; Path=/; SameSite={COOKIE_SAMESITE}" + (
+    "; Secure" if COOKIE_SECURE else ""
+)
+
+# Values made only of these characters go out unquoted (``http.cookies``'s
+# legal set). Firebase refresh tokens always are; anything else is left to
+# ``set_cookie`` so its quoting still applies.
+_UNQUOTED_COOKIE_VALUE = re.compile(r"[A-Za-z0-9!#$%&'*+\-.^_`|~:]+")
+
+# Clearing a cookie never varies at all. ``delete_cookie`` stamps ``expires``
+# with the current time; the epoch says the same thing and stays constant.
+_CLEARED_AUTH_COOKIES = tuple(
+    f'{key}=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly; Max-Age=0'
+    f"{_COOKIE_TAIL}"
+    for key in AUTH_COOKIE_KEYS
+)
+
+
+def _append_cookie(
+    response: Response, key: str, value: str, max_age: int | None
+) -> None:
+    if not _UNQUOTED_COOKIE_VALUE.fullmatch(value):
+        response.set_cookie(
+            key=key,
+            value=value,
+            httponly=True,
+            samesite=COOKIE_SAMESITE,
+            secure=COOKIE_SECURE,
+            max_age=max_age,
+            path="/",
+        )
+        return
+
+    max_age_attribute = "" if max_age is None else f"; Max-Age={max_age}"
+    response.headers.append(
+        "set-cookie", f"{key}={value}; HttpOnly{max_age_attribute}{_COOKIE_TAIL}"
     )
-    return {
-        "httponly": True,
-        "samesite": samesite,
-        "secure": settings.is_production,
-    }
 
 
 def set_refresh_token_cookie(
@@ -27,41 +67,15 @@ def set_refresh_token_cookie(
     Sets the HTTP-only refresh token cookie on the response object
     with a robust expiration date.
     """
-    cookie_options = get_cookie_options()
     max_age = REFRESH_TOKEN_MAX_AGE if remember_me else None
 
     # 1. Main secure HttpOnly refresh token
-    response.set_cookie(
-        key="refreshToken",
-        value=refresh_token,
-        httponly=bool(cookie_options["httponly"]),
-        samesite=cast("Literal['none', 'strict', 'lax']", cookie_options["samesite"]),
-        secure=bool(cookie_options["secure"]),
-        max_age=max_age,
-        path="/",
-    )
+    _append_cookie(response, "refreshToken", refresh_token, max_age)
 
     # 2. Lightweight cookie tracking remember_me state
-    response.set_cookie(
-        key="rememberMe",
-        value="true" if remember_me else "false",
-        httponly=True,
-        samesite=cast("Literal['none', 'strict', 'lax']", cookie_options["samesite"]),
-        secure=bool(cookie_options["secure"]),
-        max_age=max_age,
-        path="/",
-    )
+    _append_cookie(response, "rememberMe", "true" if remember_me else "false", max_age)
 
 
 def clear_auth_cookies(response: Response) -> None:
-    cookie_options = get_cookie_options()
-    for key in ("refreshToken", "rememberMe"):
-        response.delete_cookie(
-            key=key,
-            httponly=True,
-            samesite=cast(
-                "Literal['none', 'strict', 'lax']", cookie_options["samesite"]
-            ),
-            secure=bool(cookie_options["secure"]),
-            path="/",
-        )
+    for cookie in _CLEARED_AUTH_COOKIES:
+        response.headers.append("set-cookie", cookie)
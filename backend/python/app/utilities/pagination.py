@@ -1,3 +1,5 @@
+from typing import Any
+
 from sqlalchemy import Result, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,19 +10,27 @@ async def paginate_query(
     session: AsyncSession,
     statement: Select,
     params: PaginationParams,
-) -> tuple[Result, int]:
+) -> tuple[Result[Any], int]:
     """
     Apply pagination to a SQLAlchemy select statement.
 
-    Runs a count query on the statement, then applies offset/limit.
-    Returns the raw Result and total count so callers can extract items
+    Fetches the page, then counts the statement's rows. A short page — fewer
+    rows than the limit, and not an empty page past the end — is the last
+    page, so offset plus its length is already the total and the count query
+    is skipped. That covers every list that fits on one page, which is most of
+    them. Returns the raw Result and total count so callers can extract items
     however they need (.scalars().all() for single-table, .all() for joins).
     """
+    paginated_statement = statement.offset(params.offset).limit(params.limit)
+    # Buffer the page so its length can be checked before handing it back.
+    page = (await session.execute(paginated_statement)).freeze()
+    page_length = len(page.data)
+
+    if page_length < params.limit and (page_length or params.offset == 0):
+        return page(), params.offset + page_length
+
     count_statement = select(func.count()).select_from(statement.subquery())
     count_result = await session.execute(count_statement)
     total = count_result.scalar_one()
 
-    paginated_statement = statement.offset(params.offset).limit(params.limit)
-    result = await session.execute(paginated_statement)
-
-    return result, total
+    return page(), total
@@ -0,0 +1,137 @@
+"""Short-lived cache of verified Firebase ID tokens.
+
+Every protected request verifies its bearer token with
+``firebase_admin.auth.verify_id_token(..., check_revoked=True)``: an RS256
+signature check plus a revocation lookup against Firebase. The frontend fires
+several requests per page with the same token, so most of that work repeats a
+verification we finished milliseconds earlier.
+
+Entries live for at most ``VERIFIED_TOKEN_TTL_SECONDS`` and never past the
+token's own ``exp``. That TTL is also how stale a revocation can be — so the
+places that revoke a session on our side (``AuthService.revoke_tokens``, user
+deletion, password changes) call :meth:`VerifiedTokenCache.invalidate_uid` and
+the next request re-verifies immediately. Only successful verifications are
+stored; a rejected token is re-checked every time.
+
+A verification can still be in flight when its user is revoked, and would
+cache the revoked token once it returns. So each revocation bumps a
+generation: callers read :meth:`VerifiedTokenCache.generation` before
+verifying and hand it to ``put``, which drops claims for a user revoked since.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from typing import Any
+
+VERIFIED_TOKEN_TTL_SECONDS = 10.0
+VERIFIED_TOKEN_CACHE_MAX_SIZE = 10_000
+
+
+class VerifiedTokenCache:
+    """Thread-safe TTL map from a token's digest to its decoded claims.
+
+    Keyed by a SHA-256 digest so raw bearer tokens are never held in memory
+    longer than the request that carried them.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = VERIFIED_TOKEN_TTL_SECONDS,
+        max_size: int = VERIFIED_TOKEN_CACHE_MAX_SIZE,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: dict[bytes, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        # uid -> the generation its last revocation produced. Bounded by
+        # max_size: past that it is cleared and _floor takes its place, so
+        # anything verified before the clear is refused wholesale.
+        self._revoked: dict[str, int] = {}
+        self._floor = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def generation(self) -> int:
+        """Read before verifying a token; pass the result to :meth:`put`."""
+        with self._lock:
+            return self._generation
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return a copy of the cached claims for ``token``, or ``None`` if
+        absent/expired. A copy, so a caller mutating it cannot alter the entry.
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return copy.deepcopy(claims)
+
+    def put(self, token: str, claims: dict[str, Any], generation: int) -> None:
+        """Cache verified ``claims``, expiring at the TTL or the token's ``exp``.
+
+        ``generation`` is what :meth:`generation` returned before the
+        verification started; if the user has been revoked since, the claims
+        are stale and are not stored.
+        """
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, now + (exp - time.time()))
+        if expires_at <= now:
+            return
+
+        claims = copy.deepcopy(claims)
+        with self._lock:
+            if generation < self._floor or generation < self._revoked.get(
+                claims.get("uid", ""), -1
+            ):
+                return
+            if len(self._entries) >= self.max_size:
+                self._evict(now)
+            self._entries[self._key(token)] = (expires_at, claims)
+
+    def invalidate_uid(self, uid: str) -> None:
+        """Drop every cached token belonging to Firebase user ``uid``, and
+        refuse any verification of theirs already in flight.
+
+        Revocation is rare next to verification, so a linear scan is cheaper
+        overall than maintaining a second index on every ``put``.
+        """
+        with self._lock:
+            self._generation += 1
+            if len(self._revoked) >= self.max_size:
+                self._revoked.clear()
+                self._floor = self._generation
+            self._revoked[uid] = self._generation
+            for key in [
+                key
+                for key, (_, claims) in self._entries.items()
+                if claims.get("uid") == uid
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry: expired ones first, then the oldest."""
+        for key in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.max_size:
+            # dicts keep insertion order, so the first key is the oldest entry.
+            del self._entries[next(iter(self._entries))]
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -19,7 +19,14 @@ if __name__ == "__main__":
             factory=True,
         )
     else:
-        # Use app object for production
+        # Use app object for production.
+        #
+        # One worker on purpose: the app starts its job scheduler in the
+        # lifespan, so every extra worker would run each scheduled job (route
+        # reminders, freezes) again. uvloop and httptools ship with
+        # uvicorn[standard]; naming them makes a broken install fail at boot
+        # instead of quietly falling back to the slower pure-Python stack.
+        # Access lines are below log_level anyway, so skip building them.
         app = create_app()
         uvicorn.run(
             app,
@@ -27,4 +34,7 @@ if __name__ == "__main__":
             port=settings.port,
             log_level="warning",
             reload=False,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
         )
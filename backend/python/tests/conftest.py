@@ -57,6 +57,21 @@ def _block_real_email_sends() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def _clear_verified_token_cache() -> Generator[None, None, None]:
+    """Start every test with no remembered token verifications.
+
+    Tests reuse the same bearer string ("tok") while patching
+    ``verify_id_token`` to return different claims; a verification cached by
+    one test must not answer for the next.
+    """
+    from app.utilities.token_cache import verified_token_cache
+
+    verified_token_cache.clear()
+    yield
+    verified_token_cache.clear()
+
+
 async def _ensure_system_settings(test_session: AsyncSession) -> None:
     """Mirror app startup: API tests run with a settings row available."""
     from app.models.system_settings import SystemSettings
@@ -5,7 +5,8 @@ Tests the auth dependency functions in app/dependencies/auth.py by mocking
 Firebase and the auth service layer.
 """
 
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
@@ -14,7 +15,8 @@ import firebase_admin.auth
 import pytest
 from fastapi import Depends, FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.dependencies.auth import (
     DriverAccess,
@@ -27,6 +29,7 @@ from app.dependencies.auth import (
     require_self_driver_or_admin,
 )
 from app.models import get_session
+from app.utilities.token_cache import VerifiedTokenCache, verified_token_cache
 
 # ---------------------------------------------------------------------------
 # Helpers — minimal FastAPI app wired with a single auth dependency
@@ -234,6 +237,123 @@ class TestRequireAuthorizationByRole:
         assert verify.call_args.kwargs["check_revoked"] is True
 
 
+# ---------------------------------------------------------------------------
+# Verified-token cache
+# ---------------------------------------------------------------------------
+
+
+class TestVerifiedTokenCache:
+    """A token verified moments ago is not re-verified — unless we revoked it."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_verify_once(self) -> None:
+        app = _make_app(require_admin)
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            return_value=_token(role="admin"),
+        ) as verify:
+            first = await _get(app, {"Authorization": "Bearer tok"})
+            second = await _get(app, {"Authorization": "Bearer tok"})
+
+        assert first.status_code == second.status_code == 200
+        assert verify.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self) -> None:
+        app = _make_app(require_admin)
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            side_effect=[Exception("network blip"), _token(role="admin")],
+        ):
+            first = await _get(app, {"Authorization": "Bearer tok"})
+            second = await _get(app, {"Authorization": "Bearer tok"})
+
+        assert first.status_code == 401
+        assert second.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_invalidate_uid_forces_reverification(self) -> None:
+        """Revoking on our side must not leave a cached session usable."""
+        app = _make_app(require_admin)
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            side_effect=[
+                _token(role="admin", uid="fb-uid"),
+                firebase_admin.auth.RevokedIdTokenError("revoked"),
+            ],
+        ):
+            first = await _get(app, {"Authorization": "Bearer tok"})
+            verified_token_cache.invalidate_uid("fb-uid")
+            second = await _get(app, {"Authorization": "Bearer tok"})
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_revocation_during_verification_is_not_cached(self) -> None:
+        """A verification that started before the revocation must not put the
+        revoked token back in the cache when it returns."""
+        app = _make_app(require_admin)
+
+        calls = iter(["revoked-mid-flight", "revoked"])
+
+        def verify(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+            if next(calls) == "revoked":
+                raise firebase_admin.auth.RevokedIdTokenError("revoked")
+            verified_token_cache.invalidate_uid("fb-uid")
+            return _token(role="admin", uid="fb-uid")
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            side_effect=verify,
+        ):
+            first = await _get(app, {"Authorization": "Bearer tok"})
+            second = await _get(app, {"Authorization": "Bearer tok"})
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+
+    def test_stale_put_is_refused_after_revocations_overflow(self) -> None:
+        cache = VerifiedTokenCache(max_size=1)
+        started = cache.generation()
+        cache.invalidate_uid("a")
+        cache.invalidate_uid("b")
+        cache.put("tok", {"uid": "a"}, started)
+        assert cache.get("tok") is None
+
+    def test_mutating_claims_leaves_the_entry_intact(self) -> None:
+        cache = VerifiedTokenCache()
+        claims = {"uid": "fb-uid", "firebase": {"sign_in_provider": "password"}}
+        cache.put("tok", claims, 0)
+        claims["uid"] = "other"
+
+        cached = cache.get("tok")
+        assert cached is not None
+        cached["firebase"]["sign_in_provider"] = "custom"
+        cached["role"] = "admin"
+
+        assert cache.get("tok") == {
+            "uid": "fb-uid",
+            "firebase": {"sign_in_provider": "password"},
+        }
+
+    def test_entry_never_outlives_token_exp(self) -> None:
+        cache = VerifiedTokenCache(ttl_seconds=60)
+        cache.put("tok", {"uid": "fb-uid", "exp": time.time() - 1}, 0)
+        assert cache.get("tok") is None
+
+    def test_full_cache_evicts_oldest_entry(self) -> None:
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a", {"uid": "a"}, 0)
+        cache.put("b", {"uid": "b"}, 0)
+        cache.put("c", {"uid": "c"}, 0)
+        assert cache.get("a") is None
+        assert cache.get("c") == {"uid": "c"}
+
+
 # ---------------------------------------------------------------------------
 # require_admin (pre-built dependency)
 # ---------------------------------------------------------------------------
@@ -766,3 +886,72 @@ class TestPathParamMisconfiguration:
         app = _make_driver_id_app()
         resp = await _get_driver(app, "not-a-uuid", {"Authorization": "Bearer tok"})
         assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Rejected requests never reach the connection pool
+# ---------------------------------------------------------------------------
+
+
+class TestRejectedRequestsHoldNoConnection:
+    """Auth dependencies that take a session must not spend it on a rejection.
+
+    ``AsyncSession`` only checks a connection out of the pool on its first
+    statement, so a session that is injected but never used costs nothing.
+    Each dependency verifies the token — and takes the admin shortcut — before
+    it queries, which keeps a flood of bad tokens from draining the pool that
+    legitimate requests are waiting on. These tests pin that ordering.
+    """
+
+    @pytest.fixture
+    def checkouts(self, test_db_engine: Any) -> Generator[list[object], None, None]:
+        maker = async_sessionmaker(test_db_engine, expire_on_commit=False)
+        pool_checkouts: list[object] = []
+
+        def _on_checkout(*_args: Any) -> None:
+            pool_checkouts.append(object())
+
+        async def _real_session() -> AsyncGenerator[AsyncSession, None]:
+            async with maker() as session:
+                yield session
+
+        event.listen(test_db_engine.sync_engine, "checkout", _on_checkout)
+        self.override = _real_session
+        yield pool_checkouts
+        event.remove(test_db_engine.sync_engine, "checkout", _on_checkout)
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_checks_out_no_connection(
+        self, checkouts: list[object]
+    ) -> None:
+        app = _make_driver_id_app()
+        app.dependency_overrides[get_session] = self.override
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            side_effect=firebase_admin.auth.InvalidIdTokenError("bad"),
+        ):
+            resp = await _get_driver(
+                app, str(uuid4()), {"Authorization": "Bearer bad-token"}
+            )
+
+        assert resp.status_code == 401
+        assert checkouts == []
+
+    @pytest.mark.asyncio
+    async def test_admin_shortcut_checks_out_no_connection(
+        self, checkouts: list[object]
+    ) -> None:
+        app = _make_route_id_app()
+        app.dependency_overrides[get_session] = self.override
+
+        with patch(
+            "app.dependencies.auth.firebase_admin.auth.verify_id_token",
+            return_value=_token(role="admin"),
+        ):
+            resp = await _get_route(
+                app, str(uuid4()), {"Authorization": "Bearer admin-token"}
+            )
+
+        assert resp.status_code == 200
+        assert checkouts == []
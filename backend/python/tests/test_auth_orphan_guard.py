@@ -167,3 +167,26 @@ async def test_real_driver_still_gets_a_password_reset_token(
     dispatch.assert_called_once()
     tokens = (await test_session.execute(select(PasswordResetToken))).scalars().all()
     assert len(tokens) == 1
+
+
+async def test_failed_reset_email_does_not_fail_the_request(
+    async_client: AsyncClient, test_session: AsyncSession
+) -> None:
+    """The email goes out after the 204, so a Gmail failure is only logged."""
+    await _make_user(
+        test_session, email="real.driver@example.com", role="driver", with_driver=True
+    )
+
+    with patch(
+        "app.services.implementations.email_dispatcher.EmailDispatcher.dispatch",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("gmail unavailable"),
+    ) as dispatch:
+        response = await async_client.post(
+            "/auth/forgot-password", json={"email": "real.driver@example.com"}
+        )
+
+    assert response.status_code == 204
+    dispatch.assert_called_once()
+    tokens = (await test_session.execute(select(PasswordResetToken))).scalars().all()
+    assert len(tokens) == 1
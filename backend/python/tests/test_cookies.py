@@ -0,0 +1,72 @@
+"""The hand-built auth cookies must stay byte-for-byte what Starlette would send.
+
+``app.utilities.cookies`` writes its ``Set-Cookie`` headers directly rather than
+going through ``Response.set_cookie``. These tests hold it to the exact header
+``set_cookie`` produces for the same attributes, so a browser sees no change.
+"""
+
+import pytest
+from fastapi import Response
+
+from app.utilities.cookies import (
+    AUTH_COOKIE_KEYS,
+    COOKIE_SAMESITE,
+    COOKIE_SECURE,
+    REFRESH_TOKEN_MAX_AGE,
+    clear_auth_cookies,
+    set_refresh_token_cookie,
+)
+
+
+def _set_cookie_headers(response: Response) -> list[bytes]:
+    return [value for key, value in response.raw_headers if key == b"set-cookie"]
+
+
+def _starlette_cookie(key: str, value: str, max_age: int | None) -> bytes:
+    response = Response()
+    response.set_cookie(
+        key=key,
+        value=value,
+        httponly=True,
+        samesite=COOKIE_SAMESITE,
+        secure=COOKIE_SECURE,
+        max_age=max_age,
+        path="/",
+    )
+    (header,) = _set_cookie_headers(response)
+    return header
+
+
+@pytest.mark.parametrize("remember_me", [True, False])
+@pytest.mark.parametrize(
+    "refresh_token",
+    [
+        pytest.param("AMf-vBzI_3xk9Q-tH0r7Lw", id="firebase-shaped"),
+        pytest.param("needs/quoting=", id="quoted-by-set-cookie"),
+    ],
+)
+def test_refresh_cookies_match_set_cookie(
+    refresh_token: str, remember_me: bool
+) -> None:
+    response = Response()
+    set_refresh_token_cookie(response, refresh_token, remember_me)
+
+    max_age = REFRESH_TOKEN_MAX_AGE if remember_me else None
+    assert _set_cookie_headers(response) == [
+        _starlette_cookie("refreshToken", refresh_token, max_age),
+        _starlette_cookie("rememberMe", "true" if remember_me else "false", max_age),
+    ]
+
+
+def test_cleared_cookies_expire_immediately() -> None:
+    response = Response()
+    clear_auth_cookies(response)
+
+    headers = _set_cookie_headers(response)
+    assert len(headers) == len(AUTH_COOKIE_KEYS)
+    for key, header in zip(AUTH_COOKIE_KEYS, headers, strict=True):
+        # delete_cookie stamps ``expires`` with "now", so compare around it.
+        expected = _starlette_cookie(key, "", 0).replace(
+            b"HttpOnly", b"expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly"
+        )
+        assert header == expected
@@ -0,0 +1,63 @@
+"""The Firebase REST client is shared by every user's sign-in, so nothing one
+call receives may ride along on the next."""
+
+import json
+import logging
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from app.utilities import firebase_rest_client
+from app.utilities.firebase_rest_client import FirebaseRestClient
+
+
+class _FirebaseStub(BaseHTTPRequestHandler):
+    """Answers every sign-in with tokens and a cookie, and records what the
+    client sent back."""
+
+    received_cookies: ClassVar[list[str | None]] = []
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.received_cookies.append(self.headers.get("Cookie"))
+        body = json.dumps({"idToken": "id", "refreshToken": "refresh"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "NID=first-user; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def firebase_url(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    _FirebaseStub.received_cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FirebaseStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        firebase_rest_client,
+        "FIREBASE_SIGN_IN_URL",
+        f"http://127.0.0.1:{server.server_port}/v1/accounts:signInWithPassword",
+    )
+    yield
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.mark.usefixtures("firebase_url")
+def test_cookie_from_one_call_is_not_sent_on_the_next() -> None:
+    client = FirebaseRestClient(logging.getLogger(__name__))
+
+    client.sign_in_with_password("first@test.dev", "Testing123!")
+    client.sign_in_with_password("second@test.dev", "Testing123!")
+
+    assert _FirebaseStub.received_cookies == [None, None]
+    assert not client.http.cookies
@@ -29,6 +29,7 @@ from app.models.route_stop_snapshot import RouteStopSnapshot
 from app.models.system_settings import SystemSettings
 from app.models.user import User
 from app.services.implementations.driver_history_service import DriverHistoryService
+from app.services.implementations.driver_report_service import DriverReportService
 from app.services.implementations.location_service import (
     LocationInUseError,
     LocationService,
@@ -483,6 +484,46 @@ async def test_yearly_totals_sum_all_months(
     assert totals[a] == pytest.approx(FROZEN_KM + 10.0)
 
 
+@pytest.mark.asyncio
+async def test_export_totals_split_by_year(
+    test_session: AsyncSession, frozen_world: dict[str, Any]
+) -> None:
+    """The export's single two-year query matches one yearly query per year."""
+    a = frozen_world["driver_a"].driver_id
+    year = frozen_world["yesterday"].year
+
+    await _add_frozen_route(
+        test_session, a, frozen_world["locations"][1], date(year - 1, 6, 10), 7.0
+    )
+
+    current, previous = await history_service.get_export_totals_by_driver(
+        test_session, year
+    )
+    assert current == await history_service.get_yearly_totals_by_driver(
+        test_session, year
+    )
+    assert previous == await history_service.get_yearly_totals_by_driver(
+        test_session, year - 1
+    )
+    assert previous[a] == pytest.approx(7.0)
+
+
+@pytest.mark.asyncio
+async def test_report_monthly_totals_in_one_query(
+    test_session: AsyncSession, frozen_world: dict[str, Any]
+) -> None:
+    """The monthly report's km and delivery count come back from one query:
+    yesterday's frozen route and its single stop snapshot."""
+    yesterday = frozen_world["yesterday"]
+    report_service = DriverReportService(logger)
+
+    total_km, total_deliveries = await report_service.get_monthly_totals(
+        test_session, yesterday.year, yesterday.month
+    )
+    assert total_km == pytest.approx(FROZEN_KM)
+    assert total_deliveries == 1
+
+
 # ---------------------------------------------------------------------------
 # Driver delete
 # ---------------------------------------------------------------------------
@@ -593,14 +634,18 @@ async def test_monthly_totals_rejects_month_without_year(
 async def test_history_csv_export(
     async_client: Any, frozen_world: dict[str, Any]
 ) -> None:
-    """GET /drivers/all/history/{year}/export streams a CSV of every driver's
+    """GET /drivers/all/history/{year}/export returns a CSV of every driver's
     yearly km (driver_id must be the literal "all")."""
     year = frozen_world["yesterday"].year
 
     resp = await async_client.get(f"/drivers/all/history/{year}/export")
     assert resp.status_code == 200, resp.text
     assert "text/csv" in resp.headers.get("content-type", "")
+    assert int(resp.headers["content-length"]) == len(resp.content)
     assert f"distance (km) in {year}" in resp.text
+    # Only drivers with km in either year are rows; spare driver B has none.
+    assert "alice@test.dev" in resp.text
+    assert "bob@test.dev" not in resp.text
 
     not_all = await async_client.get(f"/drivers/{uuid4()}/history/{year}/export")
     assert not_all.status_code == 400
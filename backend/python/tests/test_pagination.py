@@ -4,11 +4,19 @@ Unit tests for the pagination schema and utility.
 Tests cover:
 - PaginationParams defaults, offset/limit calculation, validation
 - PaginatedResponse.create() total_pages calculation and edge cases
+- paginate_query() totals, with and without the count query
 """
 
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
 
+from app.models.user import User
 from app.schemas.pagination import PaginatedResponse, PaginationParams
+from app.utilities.pagination import paginate_query
 
 
 class TestPaginationParams:
@@ -82,3 +90,59 @@ class TestPaginatedResponse:
         resp = PaginatedResponse.create(items=[1], total=51, page=2, page_size=50)
         assert resp.total_pages == 2
         assert resp.page == 2
+
+
+class TestPaginateQuery:
+    """Test suite for paginate_query."""
+
+    @pytest_asyncio.fixture
+    async def five_users(self, test_session: AsyncSession) -> None:
+        test_session.add_all(
+            User(
+                auth_id=None,
+                first_name=f"U{i}",
+                last_name="Page",
+                email=f"u{i}@page.dev",
+            )
+            for i in range(5)
+        )
+        await test_session.flush()
+
+    @staticmethod
+    async def _paginate(
+        session: AsyncSession, page: int, page_size: int
+    ) -> tuple[list[str], int, int]:
+        """Page through the seeded users; also report how many queries ran."""
+        statement = (
+            select(User).where(User.last_name == "Page").order_by(col(User.email))
+        )
+        with patch.object(session, "execute", wraps=session.execute) as execute:
+            result, total = await paginate_query(
+                session, statement, PaginationParams(page=page, page_size=page_size)
+            )
+        emails = [user.email for user in result.scalars().all()]
+        return emails, total, execute.await_count
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("five_users")
+    async def test_short_page_skips_count(self, test_session: AsyncSession) -> None:
+        emails, total, queries = await self._paginate(test_session, 2, 3)
+        assert emails == ["u3@page.dev", "u4@page.dev"]
+        assert total == 5
+        assert queries == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("five_users")
+    async def test_full_page_counts(self, test_session: AsyncSession) -> None:
+        emails, total, queries = await self._paginate(test_session, 1, 3)
+        assert len(emails) == 3
+        assert total == 5
+        assert queries == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("five_users")
+    async def test_page_past_end_counts(self, test_session: AsyncSession) -> None:
+        emails, total, queries = await self._paginate(test_session, 4, 3)
+        assert emails == []
+        assert total == 5
+        assert queries == 2
@@ -0,0 +1,156 @@
+"""Every JSON endpoint must declare what it returns.
+
+With a response model (``response_model=`` or a return annotation), FastAPI
+validates the return value and serializes it to JSON bytes in one pass inside
+pydantic-core. Without one it falls back to ``jsonable_encoder`` — a recursive
+pure-Python walk of the payload — followed by the stdlib ``json.dumps``. That
+fallback is several times slower on the list endpoints, and it is also why
+swapping in ``ORJSONResponse`` buys nothing here: FastAPI deprecated it in
+favour of exactly the response-model path these routes already take.
+
+The OpenAPI schema is the public view of that declaration: an endpoint with no
+response model documents its JSON body with an empty schema.
+
+Large bodies are then gzipped on the way out; small ones are not worth it, and
+bodies carrying an access token are never compressed.
+"""
+
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter
+from fastapi.routing import APIRoute, iter_route_contexts
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+
+from app import UNCOMPRESSED_PATHS, create_app
+from app.dependencies.services import get_auth_service
+from app.models import get_session
+from app.schemas.auth import AuthResponse
+
+ALLOWED_ORIGIN = "http://localhost:3000"
+
+
+def _json_success_responses() -> list[tuple[str, str, str, dict[str, Any]]]:
+    spec = create_app().openapi()
+    return [
+        (method.upper(), path, code, response)
+        for path, operations in spec["paths"].items()
+        for method, operation in operations.items()
+        for code, response in operation["responses"].items()
+        if code.startswith("2") and "application/json" in response.get("content", {})
+    ]
+
+
+def test_every_json_endpoint_has_a_response_model() -> None:
+    responses = _json_success_responses()
+    assert responses, "expected the app to expose JSON endpoints"
+
+    untyped = [
+        f"{method} {path} ({code})"
+        for method, path, code, response in responses
+        if not response["content"]["application/json"].get("schema")
+    ]
+    assert not untyped, (
+        "These endpoints return JSON without a response model, so FastAPI "
+        f"serializes them through jsonable_encoder + json.dumps: {untyped}"
+    )
+
+
+probe_router = APIRouter(prefix="/_probe")
+
+
+@probe_router.get("/large")
+async def probe_large() -> list[str]:
+    return ["Waterloo Region delivery stop"] * 100
+
+
+@probe_router.get("/small")
+async def probe_small() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@pytest.fixture
+def probe_client() -> AsyncClient:
+    app = create_app()
+    app.include_router(probe_router)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestCompression:
+    @pytest.mark.asyncio
+    async def test_large_body_is_gzipped(self, probe_client: AsyncClient) -> None:
+        async with probe_client as client:
+            response = await client.get(
+                "/_probe/large",
+                headers={"Accept-Encoding": "gzip", "Origin": ALLOWED_ORIGIN},
+            )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert len(response.json()) == 100
+
+    @pytest.mark.asyncio
+    async def test_small_body_is_left_alone(self, probe_client: AsyncClient) -> None:
+        async with probe_client as client:
+            response = await client.get(
+                "/_probe/small", headers={"Accept-Encoding": "gzip"}
+            )
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_auth_token_body_is_never_gzipped(self) -> None:
+        """A login body is well over minimum_size, but it carries the ID token,
+        so it must go out uncompressed (BREACH)."""
+        auth_dto = AuthResponse(
+            access_token="t" * 1500,
+            id=uuid4(),
+            first_name="Test",
+            last_name="Driver",
+            email="driver@test.dev",
+            role="driver",
+            remember_me=False,
+        )
+
+        class _FakeAuthService:
+            async def generate_token(self, *_args: Any) -> tuple[AuthResponse, str]:
+                return auth_dto, "refresh-token"
+
+        async def _no_session() -> AsyncGenerator[None, None]:
+            yield None
+
+        app = create_app()
+        app.dependency_overrides[get_auth_service] = _FakeAuthService
+        app.dependency_overrides[get_session] = _no_session
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/auth/login",
+                json={"email": "driver@test.dev", "password": "Testing123!"},
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+        assert response.status_code == 200
+        assert len(response.content) > 1000
+        assert "content-encoding" not in response.headers
+        assert response.json()["access_token"] == auth_dto.access_token
+
+
+def test_every_token_bearing_route_is_left_uncompressed() -> None:
+    """A new endpoint that returns an access token must join UNCOMPRESSED_PATHS."""
+    token_paths = {
+        context.path
+        for context in iter_route_contexts(create_app().routes)
+        if isinstance(route := context.original_route, APIRoute)
+        and route.response_model is not None
+        and "access_token"
+        in json.dumps(TypeAdapter(route.response_model).json_schema())
+    }
+
+    assert token_paths == UNCOMPRESSED_PATHS
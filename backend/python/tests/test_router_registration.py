@@ -0,0 +1,31 @@
+"""Every router is mounted once, and the startup guard can tell when it isn't.
+
+``app.routes`` lists one ``_IncludedRouter`` per ``include_router`` call on
+FastAPI 0.137, not the routes inside it. ``_assert_unique_operation_ids`` used
+to walk it looking for ``APIRoute``s, found none, and so passed no matter what
+was registered. These tests keep it pointed at the real routes.
+"""
+
+import pytest
+from fastapi import FastAPI
+
+from app import _assert_unique_operation_ids, create_app
+from app.routers import ROUTERS, auth_routes
+
+
+def test_routers_are_listed_once() -> None:
+    assert len({id(router) for router in ROUTERS}) == len(ROUTERS)
+
+
+def test_guard_sees_included_routes() -> None:
+    app = FastAPI()
+    app.include_router(auth_routes.router)
+    app.include_router(auth_routes.router)
+
+    with pytest.raises(ValueError, match="Duplicate OpenAPI operation ID 'login'"):
+        _assert_unique_operation_ids(app)
+
+
+def test_real_app_passes_the_guard() -> None:
+    # create_app runs the guard itself; this pins that it does so cleanly.
+    assert create_app().openapi()["paths"]
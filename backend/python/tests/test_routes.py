@@ -205,7 +205,7 @@ class TestDriverRoutes:
                 return_value=fake_user_invite,
             ),
             patch(
-                "app.services.implementations.auth_service.AuthService.generate_token",
+                "app.services.implementations.auth_service.AuthService.generate_token_for_user",
                 return_value=(fake_auth_dto, "fake_refresh_token"),
             ),
         ):
@@ -227,6 +227,115 @@ class TestDriverRoutes:
             assert "access_token" in data["auth"]
             assert "driver_id" in data["driver"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("commit_error", "sign_in_fails_on_cancel"),
+        [
+            pytest.param(None, False, id="commit-succeeds"),
+            pytest.param(RuntimeError("commit failed"), False, id="both-fail"),
+            pytest.param(
+                RuntimeError("commit failed"), True, id="both-fail-sign-in-on-cancel"
+            ),
+        ],
+    )
+    async def test_register_driver_sign_in_failure_finishes_commit(
+        self,
+        async_client: AsyncClient,
+        sample_driver_data: dict[str, Any],
+        commit_error: Exception | None,
+        sign_in_fails_on_cancel: bool,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failed Firebase sign-in after registration answers 500, but only
+        once the commit it overlaps has finished — the session is never torn
+        down with the commit still in flight. If the commit fails too, the
+        abandoned sign-in's error is still retrieved, whenever it arrives,
+        rather than left for asyncio to log."""
+        import asyncio
+        import gc
+
+        from app.models.driver import Driver
+        from app.models.user import User
+        from app.models.user_invite import UserInvite
+
+        mock_firebase_user = MagicMock()
+        mock_firebase_user.uid = "fake-auth-id-456"
+
+        fake_user = User(
+            user_id=uuid4(),
+            auth_id=None,
+            email="signinfails@gmail.com",
+            first_name="Test",
+            last_name="User",
+            role="driver",
+        )
+        fake_user.driver = Driver(
+            user_id=fake_user.user_id,
+            phone=sample_driver_data["phone"],
+            address=sample_driver_data["address"],
+            license_plate=sample_driver_data["license_plate"],
+            car_make_model=sample_driver_data["car_make_model"],
+        )
+        fake_user_invite = UserInvite(
+            user_invite_id=uuid4(),
+            user_id=fake_user.user_id,
+            is_used=False,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=2),
+        )
+        fake_user_invite.user = fake_user
+
+        commit_finished = False
+
+        async def slow_commit(*_args: Any, **_kwargs: Any) -> None:
+            nonlocal commit_finished
+            # Yield to the loop so the sign-in fails while this is in flight.
+            await asyncio.sleep(0.05)
+            commit_finished = True
+            if commit_error is not None:
+                raise commit_error
+
+        async def failing_sign_in(*_args: Any, **_kwargs: Any) -> None:
+            if sign_in_fails_on_cancel:
+                # Still running when the failed commit cancels it, and failing
+                # on the way out rather than ending cancelled.
+                try:
+                    await asyncio.sleep(1)
+                finally:
+                    raise ValueError("Firebase sign-in failed")
+            raise ValueError("Firebase sign-in failed")
+
+        with (
+            patch("firebase_admin.auth.create_user", return_value=mock_firebase_user),
+            patch("firebase_admin.auth.set_custom_user_claims"),
+            patch("firebase_admin.auth.delete_user"),
+            patch(
+                "sqlalchemy.ext.asyncio.AsyncSession.refresh", new_callable=AsyncMock
+            ),
+            patch("sqlalchemy.ext.asyncio.AsyncSession.commit", new=slow_commit),
+            patch(
+                "app.services.implementations.user_invite_service.UserInviteService.get_user_invite_by_id",
+                return_value=fake_user_invite,
+            ),
+            patch(
+                "app.services.implementations.auth_service.AuthService.generate_token_for_user",
+                new=failing_sign_in,
+            ),
+        ):
+            response = await async_client.post(
+                "/drivers/register",
+                json={
+                    "user_invite_id": str(fake_user_invite.user_invite_id),
+                    "password": "Testing123!",
+                },
+            )
+
+        assert response.status_code == 500
+        assert commit_finished
+        assert fake_user_invite.is_used is True
+
+        gc.collect()
+        assert "never retrieved" not in caplog.text
+
     @pytest.mark.asyncio
     async def test_get_drivers_with_data(
         self, async_client: AsyncClient, test_driver: Any
@@ -5601,15 +5710,15 @@ class TestJobRoutes:
         The job service is faked so the test doesn't kick off real
         route-generation/scheduler work.
         """
-        from app.routers.job_routes import get_job_service
+        from app.dependencies.services import get_job_service
 
         job_id = uuid4()
 
         class _FakeJobService:
-            async def generate_job(self, _req: Any = None) -> Any:
+            async def generate_job(self, _session: Any, _req: Any = None) -> Any:
                 return job_id
 
-            async def enqueue(self, _job_id: Any) -> None:
+            async def enqueue(self, _session: Any, _job_id: Any) -> None:
                 return None
 
         client = await client_with_overrides({get_job_service: _FakeJobService})
@@ -5639,10 +5748,10 @@ class TestJobRoutes:
             ),
         )
 
-        service = JobService(logger=MagicMock(), session=test_session)
-        job_id = await service.generate_job(req)
+        service = JobService(logger=MagicMock())
+        job_id = await service.generate_job(test_session, req)
 
-        job = await service.get_job(job_id)
+        job = await service.get_job(test_session, job_id)
         assert job is not None
         assert job.input_payload is not None
 
@@ -5657,10 +5766,10 @@ class TestJobRoutes:
         """generate_job(None) is still valid and stores no payload."""
         from app.services.implementations.job_service import JobService
 
-        service = JobService(logger=MagicMock(), session=test_session)
-        job_id = await service.generate_job()
+        service = JobService(logger=MagicMock())
+        job_id = await service.generate_job(test_session)
 
-        job = await service.get_job(job_id)
+        job = await service.get_job(test_session, job_id)
         assert job is not None
         assert job.input_payload is None
 
@@ -5701,8 +5810,8 @@ class TestJobRoutes:
         assert response.status_code == 200
         assert response.json()["progress"] == "Cancelled"
 
-        service = JobService(logger=MagicMock(), session=test_session)
-        await service.update_progress(job.job_id, ProgressEnum.COMPLETED)
+        service = JobService(logger=MagicMock())
+        await service.update_progress(test_session, job.job_id, ProgressEnum.COMPLETED)
         await test_session.refresh(job)
         assert job.progress == ProgressEnum.CANCELLED
 
@@ -5743,8 +5852,8 @@ class TestJobRoutes:
         test_session.add(job)
         await test_session.commit()
 
-        service = JobService(logger=MagicMock(), session=test_session)
-        await service.enqueue(job.job_id)
+        service = JobService(logger=MagicMock())
+        await service.enqueue(test_session, job.job_id)
 
         await test_session.refresh(job)
         assert job.progress == ProgressEnum.CANCELLED
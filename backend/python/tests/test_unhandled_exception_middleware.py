@@ -17,6 +17,7 @@ import pytest
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
 
 from app import create_app
 
@@ -199,3 +200,26 @@ class TestNoBlanketHandlersRemain:
             "logs the traceback and returns a 500 that leaks nothing, instead "
             f"of raising your own: {offenders}"
         )
+
+
+class TestMiddlewareStackIsPureASGI:
+    """Structural guard: every middleware must be a plain ASGI callable.
+
+    ``BaseHTTPMiddleware`` (and ``@app.middleware("http")``, which is built on
+    it) runs each request through an extra task group and re-wraps the
+    response stream, a latency tax on every call. It also changes how errors
+    propagate, which the 500 handler above relies on.
+    """
+
+    def test_no_base_http_middleware(self) -> None:
+        offenders = [
+            middleware.cls.__name__
+            for middleware in create_app().user_middleware
+            if isinstance(middleware.cls, type)
+            and issubclass(middleware.cls, BaseHTTPMiddleware)
+        ]
+        assert offenders == [], (
+            "Write middleware as an ASGI class with "
+            "`async def __call__(self, scope, receive, send)` — see "
+            f"UnhandledExceptionMiddleware — instead of: {offenders}"
+        )